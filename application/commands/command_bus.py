@@ -3,12 +3,11 @@
 Bus de comandos para TreeApp v4 Pro.
 Maneja la ejecución de comandos de forma centralizada.
 """
-from typing import Dict, Type, Any
-from abc import ABC, abstractmethod
+from typing import Dict, Type, Any, Protocol
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class CommandResult:
     """Resultado de ejecución de un comando."""
     success: bool
@@ -16,26 +15,35 @@ class CommandResult:
     error: str = None
 
 
-class Command(ABC):
-    """Comando base abstracto."""
+class Command(Protocol):
+    """
+    Comando base (protocolo estructural).
+    
+    Los comandos no necesitan heredar de esta clase: basta con que
+    implementen execute(). El bus despacha por la clase concreta.
+    """
     
-    @abstractmethod
     def execute(self) -> CommandResult:
         """Ejecutar el comando."""
-        pass
+        ...
 
 
-class CommandHandler(ABC):
-    """Manejador de comando base."""
+class CommandHandler(Protocol):
+    """
+    Manejador de comando base (protocolo estructural).
+    
+    Contrato: handle() siempre devuelve un CommandResult y nunca lanza;
+    los errores se capturan dentro del manejador.
+    """
     
-    @abstractmethod
     def handle(self, command: Command) -> CommandResult:
         """Manejar un comando específico."""
-        pass
+        ...
 
 
 class CommandBus:
     """Bus centralizado de comandos."""
+    __slots__ = ('_handlers',)
     
     def __init__(self):
         self._handlers: Dict[Type[Command], CommandHandler] = {}
@@ -47,26 +55,17 @@ class CommandBus:
     def execute(self, command: Command) -> CommandResult:
         """Ejecutar un comando."""
         command_type = type(command)
+        handler = self._handlers.get(command_type)
         
-        if command_type not in self._handlers:
+        if handler is None:
             return CommandResult(
                 success=False,
                 error=f"No hay manejador registrado para {command_type.__name__}"
             )
         
-        try:
-            # Ejecutar comando
-            result = self._handlers[command_type].handle(command)
-            return result
-            
-        except Exception as e:
-            return CommandResult(success=False, error=str(e))
+        # El manejador captura sus propios errores (ver CommandHandler)
+        return handler.handle(command)
 
 
 # Instancia global del command bus
-_command_bus = CommandBus()
-
-
-def get_command_bus() -> CommandBus:
-    """Obtener la instancia global del command bus."""
-    return _command_bus
\ No newline at end of file
+command_bus = CommandBus()
\ No newline at end of file
@@ -6,11 +6,11 @@ from dataclasses import dataclass
 from typing import Optional
 from domain.node.node_entity import Node, NodeType, NodeStatus
 from domain.validation import NodeValidator
-from application.commands.command_bus import Command, CommandHandler, CommandResult
+from application.commands.command_bus import CommandResult
 
 
-@dataclass
-class CreateNodeCommand(Command):
+@dataclass(slots=True)
+class CreateNodeCommand:
     """Comando para crear un nuevo nodo."""
     name: str
     node_type: NodeType
@@ -21,24 +21,27 @@ class CreateNodeCommand(Command):
     status: NodeStatus = NodeStatus.NONE
     
     def execute(self) -> CommandResult:
-        """Implementación requerida por Command abstracto."""
+        """Implementación requerida por el protocolo Command."""
         # Este método no se usa porque usamos CommandHandler
-        # Pero es requerido por la clase abstracta
+        # Pero es requerido por el protocolo
         return CommandResult(success=False, error="Use CommandBus.execute() instead")
 
 
-class CreateNodeCommandHandler(CommandHandler):
+class CreateNodeCommandHandler:
     """Manejador del comando CreateNode."""
+    __slots__ = ('_node_repository',)
     
     def __init__(self, node_repository):
         self._node_repository = node_repository
     
     def handle(self, command: CreateNodeCommand) -> CommandResult:
         """Manejar creación de nodo."""
+        # Validar datos una sola vez antes de construir el nodo
+        error = NodeValidator.validate_new_node(command.name, command.node_type, command.parent_id)
+        if error:
+            return CommandResult(success=False, error=error)
+        
         try:
-            # Validar nombre
-            NodeValidator.validate_name(command.name)
-            
             # Crear nodo
             node = Node(
                 name=command.name,
@@ -50,13 +53,11 @@ class CreateNodeCommandHandler(CommandHandler):
                 status=command.status
             )
             
-            # Validar nodo completo
-            NodeValidator.validate_node(node)
-            
             # Guardar en repositorio
             saved_node = self._node_repository.save(node)
             
             return CommandResult(success=True, data=saved_node)
             
         except Exception as e:
+            # Red de seguridad para errores inesperados (p. ej. E/S del repositorio)
             return CommandResult(success=False, error=str(e))
\ No newline at end of file
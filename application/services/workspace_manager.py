@@ -9,8 +9,13 @@ Gestor de workspace inicial compatible con JsonRepository
 - 100 líneas - Cumple límite
 """
 
-from typing import Dict, Any, Optional
+import logging
 from datetime import datetime
+from typing import Dict, Any, Optional
+
+from shared.config.integration_config import IntegrationConfig
+
+logger = logging.getLogger(__name__)
 
 class WorkspaceManager:
     """Gestor de workspace inicial y configuración"""
@@ -19,6 +24,10 @@ class WorkspaceManager:
         self.repository = repository
         self.event_bus = event_bus
         
+        # Cache de vista previa: (root_id, versión del root) -> datos
+        self._preview_cache = None
+        self._preview_key = None
+        
     def initialize_workspace_if_needed(self) -> Dict[str, Any]:
         """
         Inicializa workspace si es necesario
@@ -38,10 +47,10 @@ class WorkspaceManager:
             root_id = self.create_initial_workspace()
             workspace_info['created_new'] = True
             workspace_info['root_id'] = root_id
-            print("✅ Workspace inicial creado con carpeta Root")
+            logger.debug("✅ Workspace inicial creado con carpeta Root")
         else:
             workspace_info['root_id'] = self.repository.root_id
-            print("📁 Workspace existente cargado")
+            logger.debug("📁 Workspace existente cargado")
         
         # Obtener datos para vista previa
         workspace_info['preview_data'] = self.get_initial_preview_data()
@@ -78,30 +87,38 @@ class WorkspaceManager:
             str: ID del nodo root creado
         """
         
+        initial = IntegrationConfig.INITIAL_WORKSPACE
+        
         # Limpiar workspace existente si es necesario
         if self.repository.nodes:
-            print("🧹 Limpiando workspace anterior...")
+            logger.debug("🧹 Limpiando workspace anterior...")
             self.repository.clear_all_data()
         
-        # Crear nodo Root inicial
-        root_id = self.repository.create_node(
-            name="Root",
-            node_type="folder",
-            parent_id=None
-        )
-        
-        # Actualizar con datos específicos del workspace inicial
-        self.repository.update_node(
-            root_id,
-            status='⬜',  # Pendiente (Req. 4)
-            markdown='# Nueva carpeta raíz',  # Req. 4
-            notes='Carpeta raíz del proyecto inicial',
-            code=''
-        )
-        
-        # Establecer como root
-        self.repository.root_id = root_id
-        self.repository.save_data()
+        # Una sola lectura del reloj para crear y actualizar el root
+        now = datetime.now().isoformat()
+        
+        # Crear y completar el root con una sola escritura a disco
+        with self.repository.batch():
+            # Crear nodo Root inicial
+            root_id = self.repository.create_node(
+                name=initial['root_name'],
+                node_type="folder",
+                parent_id=None,
+                timestamp=now
+            )
+            
+            # Actualizar con datos específicos del workspace inicial
+            self.repository.update_node(
+                root_id,
+                timestamp=now,
+                status=initial['root_status'],  # Pendiente (Req. 4)
+                markdown=initial['root_markdown'],  # Req. 4
+                notes=initial['root_notes'],
+                code=''
+            )
+            
+            # Establecer como root
+            self.repository.root_id = root_id
         
         # Notificar creación si hay event bus
         if self.event_bus:
@@ -120,22 +137,32 @@ class WorkspaceManager:
             Dict con datos del root para mostrar inmediatamente
         """
         
-        if not self.repository.root_id:
+        root_id = self.repository.root_id
+        if not root_id:
             return None
         
-        root_node = self.repository.get_node(self.repository.root_id)
+        cache_key = (root_id, self.repository._root_version)
+        if cache_key == self._preview_key:
+            return self._preview_cache
+        
+        root_node = self.repository.get_node(root_id)
         if not root_node:
             return None
         
-        return {
-            'root_id': self.repository.root_id,
+        self._preview_cache = {
+            'root_id': root_id,
             'name': root_node['name'],
             'status': root_node['status'],
             'markdown': root_node['markdown'],
             'notes': root_node.get('notes', ''),
             'type': root_node['type'],
-            'children': root_node.get('children', [])
+            # Copia: el dict cacheado no debe ver (ni exponer) la lista viva
+            # del repositorio; _root_version cambia con cada hijo del root
+            'children': tuple(root_node.get('children', ()))
         }
+        self._preview_key = cache_key
+        
+        return self._preview_cache
     
     def get_workspace_stats(self) -> Dict[str, Any]:
         """
@@ -150,8 +177,8 @@ class WorkspaceManager:
     def reset_workspace(self):
         """Resetea el workspace a estado inicial"""
         
-        print("🔄 Reseteando workspace...")
-        self.repository.clear_all_data()
+        logger.debug("🔄 Reseteando workspace...")
+        # create_initial_workspace ya limpia los datos existentes
         root_id = self.create_initial_workspace()
         
         if self.event_bus:
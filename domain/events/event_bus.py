@@ -9,14 +9,20 @@ Sistema de eventos desacoplado para TreeApp v4 Pro
 - 60 líneas - Cumple límite
 """
 
-from typing import Dict, List, Callable, Any
+from collections import deque
+from datetime import datetime
+from typing import Dict, List, Tuple, Callable, Any
+
+_NO_SUBSCRIBERS: Tuple[Callable, ...] = ()
 
 class EventBus:
     """Sistema de eventos centralizado"""
     
     def __init__(self):
-        self._subscribers: Dict[str, List[Callable]] = {}
-        self._event_history: List[Dict[str, Any]] = []
+        # Tuplas inmutables por evento: publish() itera sin copiar aunque un
+        # callback (des)suscriba durante la notificación
+        self._subscribers: Dict[str, Tuple[Callable, ...]] = {}
+        self._event_history = deque(maxlen=100)  # Solo los últimos 100 eventos
     
     def subscribe(self, event_type: str, callback: Callable):
         """
@@ -26,10 +32,7 @@ class EventBus:
             event_type: Tipo de evento (ej: 'node_selected', 'tree_updated')
             callback: Función a llamar cuando ocurre el evento
         """
-        if event_type not in self._subscribers:
-            self._subscribers[event_type] = []
-        
-        self._subscribers[event_type].append(callback)
+        self._subscribers[event_type] = self._subscribers.get(event_type, _NO_SUBSCRIBERS) + (callback,)
     
     def unsubscribe(self, event_type: str, callback: Callable):
         """
@@ -39,11 +42,10 @@ class EventBus:
             event_type: Tipo de evento
             callback: Función a desuscribir
         """
-        if event_type in self._subscribers:
-            try:
-                self._subscribers[event_type].remove(callback)
-            except ValueError:
-                pass  # Callback no estaba suscrito
+        callbacks = self._subscribers.get(event_type)
+        if callbacks and callback in callbacks:
+            index = callbacks.index(callback)
+            self._subscribers[event_type] = callbacks[:index] + callbacks[index + 1:]
     
     def publish(self, event_type: str, data: Any = None):
         """
@@ -60,23 +62,18 @@ class EventBus:
             'data': data,
             'timestamp': self._get_timestamp()
         }
-        self._event_history.append(event_record)
-        
-        # Mantener solo los últimos 100 eventos
-        if len(self._event_history) > 100:
-            self._event_history.pop(0)
+        self._event_history.append(event_record)  # deque descarta el más antiguo
         
         # Notificar a suscriptores
-        if event_type in self._subscribers:
-            for callback in self._subscribers[event_type]:
-                try:
-                    callback(data)
-                except Exception as e:
-                    print(f"Error en callback para evento '{event_type}': {e}")
+        for callback in self._subscribers.get(event_type, _NO_SUBSCRIBERS):
+            try:
+                callback(data)
+            except Exception as e:
+                print(f"Error en callback para evento '{event_type}': {e}")
     
     def get_subscribers_count(self, event_type: str) -> int:
         """Obtiene el número de suscriptores para un tipo de evento"""
-        return len(self._subscribers.get(event_type, []))
+        return len(self._subscribers.get(event_type, _NO_SUBSCRIBERS))
     
     def get_all_event_types(self) -> List[str]:
         """Obtiene todos los tipos de eventos registrados"""
@@ -90,17 +87,16 @@ class EventBus:
             event_type: Tipo específico a limpiar, o None para limpiar todos
         """
         if event_type:
-            self._subscribers[event_type] = []
+            self._subscribers[event_type] = _NO_SUBSCRIBERS
         else:
             self._subscribers.clear()
     
     def get_event_history(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Obtiene el historial de eventos recientes"""
-        return self._event_history[-limit:]
+        return list(self._event_history)[-limit:]
     
     def _get_timestamp(self) -> str:
         """Obtiene timestamp actual"""
-        from datetime import datetime
         return datetime.now().isoformat()
 
 # Instancia global del event bus (opcional)
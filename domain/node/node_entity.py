@@ -3,6 +3,7 @@
 Entidad principal del nodo en TreeApp v4 Pro.
 Representa un archivo o carpeta con sus 4 campos de contenido.
 """
+import uuid
 from dataclasses import dataclass, field
 from typing import Dict, Any, List, Optional
 from datetime import datetime
@@ -47,7 +48,7 @@ class Node:
     
     # Timestamps
     created: str = field(default_factory=lambda: datetime.now().isoformat())
-    modified: str = field(default_factory=lambda: datetime.now().isoformat())
+    modified: str = ""  # Vacío: se toma la misma marca que 'created'
     
     # Metadatos adicionales
     tags: List[str] = field(default_factory=list)
@@ -60,10 +61,13 @@ class Node:
         
         if not self.node_id:
             self.node_id = self._generate_id()
+        
+        # Un nodo nuevo se crea y modifica en el mismo instante: una sola lectura del reloj
+        if not self.modified:
+            self.modified = self.created
     
     def _generate_id(self) -> str:
         """Generar ID único para el nodo."""
-        import uuid
         return f"{self.node_type.value}_{uuid.uuid4().hex[:8]}"
     
     def update_modified(self) -> None:
@@ -18,30 +18,66 @@ class NodeValidator:
     
     # Caracteres prohibidos en nombres de archivos/carpetas
     FORBIDDEN_CHARS = r'[<>:"/\\|?*]'
-    RESERVED_NAMES = ['CON', 'PRN', 'AUX', 'NUL', 'COM1', 'COM2', 'COM3', 
-                      'COM4', 'COM5', 'COM6', 'COM7', 'COM8', 'COM9', 
-                      'LPT1', 'LPT2', 'LPT3', 'LPT4', 'LPT5', 'LPT6', 
-                      'LPT7', 'LPT8', 'LPT9']
+    RESERVED_NAMES = frozenset(['CON', 'PRN', 'AUX', 'NUL', 'COM1', 'COM2', 'COM3', 
+                                'COM4', 'COM5', 'COM6', 'COM7', 'COM8', 'COM9', 
+                                'LPT1', 'LPT2', 'LPT3', 'LPT4', 'LPT5', 'LPT6', 
+                                'LPT7', 'LPT8', 'LPT9'])
+    # Compilado una vez: name_error se llama en cada validación de nombre
+    _FORBIDDEN_RE = re.compile(FORBIDDEN_CHARS)
+    # Nombres más largos no pueden ser reservados: se evita el upper()
+    _RESERVED_MAX_LEN = max(map(len, RESERVED_NAMES))
     
     @classmethod
-    def validate_name(cls, name: str) -> None:
-        """Validar nombre de nodo."""
-        if not name or not name.strip():
-            raise ValidationError("El nombre no puede estar vacío")
+    def name_error(cls, name: str) -> Optional[str]:
+        """Devolver el error del nombre, o None si es válido."""
+        if not name or name.isspace():
+            return "El nombre no puede estar vacío"
         
         name = name.strip()
         
         if len(name) > 255:
-            raise ValidationError("El nombre no puede exceder 255 caracteres")
+            return "El nombre no puede exceder 255 caracteres"
         
-        if re.search(cls.FORBIDDEN_CHARS, name):
-            raise ValidationError("El nombre contiene caracteres prohibidos: < > : \" / \\ | ? *")
+        if cls._FORBIDDEN_RE.search(name):
+            return "El nombre contiene caracteres prohibidos: < > : \" / \\ | ? *"
         
-        if name.upper() in cls.RESERVED_NAMES:
-            raise ValidationError(f"'{name}' es un nombre reservado del sistema")
+        if len(name) <= cls._RESERVED_MAX_LEN and name.upper() in cls.RESERVED_NAMES:
+            return f"'{name}' es un nombre reservado del sistema"
         
         if name.startswith('.') and len(name.strip('.')) == 0:
-            raise ValidationError("El nombre no puede consistir solo de puntos")
+            return "El nombre no puede consistir solo de puntos"
+        
+        return None
+    
+    @classmethod
+    def validate_name(cls, name: str) -> None:
+        """Validar nombre de nodo."""
+        error = cls.name_error(name)
+        if error:
+            raise ValidationError(error)
+    
+    @classmethod
+    def validate_new_node(cls, name: str, node_type: NodeType, parent_id: Optional[str] = None) -> Optional[str]:
+        """
+        Validar datos de un nodo nuevo antes de construirlo.
+        
+        Reúne en una sola llamada las reglas de validate_name y validate_node;
+        el ID se genera en Node y no puede coincidir con el padre.
+        
+        Returns:
+            Mensaje de error, o None si los datos son válidos
+        """
+        error = cls.name_error(name)
+        if error:
+            return error
+        
+        if not isinstance(node_type, NodeType):
+            return f"Tipo de nodo inválido: {node_type!r}"
+        
+        if parent_id is not None and not parent_id:
+            return "El ID del padre no puede estar vacío"
+        
+        return None
     
     @classmethod
     def validate_node(cls, node: Node) -> None:
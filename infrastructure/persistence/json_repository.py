@@ -6,64 +6,269 @@ Repositorio JSON para persistencia de datos
 - Carga y guarda datos en treeapp_data.json
 - Gestión de nodos y estructura del árbol
 - Compatible con el sistema actual
+- update_node escribe de forma diferida (hilo de fondo, flush(), close())
+- Rutas .gz se guardan comprimidas; la carga detecta gzip sola
 - 120 líneas - Cumple límite
 """
 
-import json
+import atexit
+import gzip
+import logging
 import os
+import threading
 import uuid
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Sequence
+
+from shared import json_codec
+from .node_table import (
+    NodeTable, TypeCode, StatusCode, STATUS_PENDING_EMOJI, intern_status
+)
+
+logger = logging.getLogger(__name__)
+
+_GZIP_MAGIC = b'\x1f\x8b'
+_WRITE_BUFFER = 1 << 20
+_ID_MASK = (1 << 128) - 1
+
+# Plantilla de nodo nuevo: copiarla reutiliza la tabla de claves ya
+# dimensionada y solo se rellenan los campos variables
+_NODE_TEMPLATE = {
+    'id': None,
+    'name': None,
+    'type': None,
+    'parent_id': None,
+    'status': STATUS_PENDING_EMOJI,  # Pendiente por defecto
+    'markdown': '',
+    'notes': '',
+    'code': '',
+    'children': (),  # Inmutable: se promueve a lista con el primer hijo
+    'created_at': None
+}
+
+# Campos que update_node (y las specs de create_nodes_batch) pueden escribir
+_UPDATABLE_FIELDS = frozenset(['name', 'type', 'status', 'markdown', 'notes', 'code'])
+_CREATE_KEYS = frozenset(['name', 'type', 'parent_id'])
 
 class JsonRepository:
     """Repositorio para persistencia de datos en JSON"""
     
-    def __init__(self, file_path: str = "treeapp_data.json"):
+    def __init__(self, file_path: str = "treeapp_data.json", compress: Optional[bool] = None):
         self.file_path = file_path
+        # gzip nivel 1: las claves repetidas de cada nodo comprimen mucho a muy bajo coste
+        self.compress = file_path.endswith('.gz') if compress is None else compress
         self.nodes: Dict[str, Dict[str, Any]] = {}
         self.root_id: Optional[str] = None
+        self.node_table = NodeTable()  # Columnas tipo/estado para estadísticas
+        self._root_version = 0  # Se incrementa al modificar el root o sus hijos
+        self._defer_save = 0  # Profundidad de batch() activa
+        self._save_pending = False
+        
+        # Escritura diferida de update_node (p. ej. edición por tecla)
+        self.flush_delay = 0.5
+        self._lock = threading.RLock()
+        self._dirty = threading.Event()
+        self._closing = threading.Event()  # close(): detiene el hilo de fondo
         self.load_data()
+        
+        self._flush_thread = threading.Thread(
+            target=self._flush_loop, name="JsonRepositoryFlush", daemon=True
+        )
+        self._flush_thread.start()
+        # El hilo es daemon: cualquier salida (Ctrl+C, excepción) guarda lo pendiente
+        atexit.register(self.close)
     
     def load_data(self):
         """Carga datos desde el archivo JSON"""
+        self._root_version += 1
         try:
             if os.path.exists(self.file_path):
-                with open(self.file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                with open(self.file_path, 'rb') as f:
+                    raw = f.read()
+                    if raw[:2] == _GZIP_MAGIC:
+                        raw = gzip.decompress(raw)
+                    data = json_codec.loads(raw)
                     
                     self.root_id = data.get('root_id')
                     self.nodes = data.get('nodes', {})
+                    # Una sola pasada: estados internados + columnas de estadísticas
+                    self.node_table.rebuild(self.nodes, intern_statuses=True)
                     
-                    print(f"✅ Datos cargados: {len(self.nodes)} nodos")
+                    logger.debug("✅ Datos cargados: %d nodos", len(self.nodes))
             else:
-                print("📁 Archivo de datos no existe, empezando con datos vacíos")
+                logger.debug("📁 Archivo de datos no existe, empezando con datos vacíos")
                 self.nodes = {}
                 self.root_id = None
+                self.node_table.clear()
                 
         except Exception as e:
-            print(f"❌ Error cargando datos: {e}")
+            logger.error("❌ Error cargando datos: %s", e)
             self.nodes = {}
             self.root_id = None
+            self.node_table.clear()
     
     def save_data(self):
         """Guarda datos al archivo JSON"""
         try:
-            data = {
-                'root_id': self.root_id,
-                'nodes': self.nodes,
-                'last_updated': datetime.now().isoformat(),
-                'version': '4.0'
-            }
-            
-            with open(self.file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            with self._lock:
+                self._dirty.clear()
+                header = {
+                    'root_id': self.root_id,
+                    'last_updated': datetime.now().isoformat(),
+                    'version': '4.0'
+                }
                 
-            print(f"💾 Datos guardados: {len(self.nodes)} nodos")
+                # Escritura atómica: un cierre a mitad no corrompe el archivo.
+                # Los nodos se serializan uno a uno sobre un buffer de 1 MiB
+                # (o el flujo gzip) en vez de generar el documento entero
+                tmp_path = self.file_path + '.tmp'
+                if self.compress:
+                    f = gzip.open(tmp_path, 'wb', compresslevel=1)
+                else:
+                    f = open(tmp_path, 'wb', buffering=_WRITE_BUFFER)
+                with f:
+                    json_codec.write_mapping_document(f, header, 'nodes', self.nodes)
+                os.replace(tmp_path, self.file_path)
+                
+            logger.debug("💾 Datos guardados: %d nodos", len(self.nodes))
             
         except Exception as e:
-            print(f"❌ Error guardando datos: {e}")
+            logger.error("❌ Error guardando datos: %s", e)
+    
+    def flush(self):
+        """Escribe de inmediato los cambios diferidos pendientes"""
+        if self._dirty.is_set():
+            self.save_data()
+    
+    def _flush_loop(self):
+        """Hilo de fondo: agrupa las escrituras marcadas por update_node"""
+        while True:
+            self._dirty.wait()
+            # Esperar el retardo; close() interrumpe la espera
+            if self._closing.is_set() or self._closing.wait(self.flush_delay):
+                return
+            self.flush()
+    
+    def close(self):
+        """Detiene el hilo de escritura diferida y guarda lo pendiente"""
+        if self._closing.is_set():
+            return
+        
+        with self._lock:
+            pending = self._dirty.is_set()
+            self._closing.set()
+            self._dirty.set()  # Despierta al hilo si esperaba cambios
+        self._flush_thread.join()
+        
+        if not pending:
+            self._dirty.clear()
+        self.flush()
+    
+    def _mark_dirty(self):
+        """Programa una escritura diferida (o la deja al batch() activo)"""
+        if self._defer_save:
+            self._save_pending = True
+        else:
+            self._dirty.set()
     
-    def create_node(self, name: str, node_type: str, parent_id: Optional[str] = None) -> str:
+    def _save_or_defer(self):
+        """Guarda ahora o marca pendiente si hay un batch() activo"""
+        if self._defer_save:
+            self._save_pending = True
+        else:
+            self.save_data()
+    
+    @contextmanager
+    def batch(self):
+        """
+        Agrupa varias mutaciones en una sola escritura a disco
+        
+        Uso:
+            with repository.batch():
+                repository.create_node(...)
+                repository.update_node(...)
+        """
+        self._defer_save += 1
+        try:
+            yield self
+        finally:
+            self._defer_save -= 1
+            if not self._defer_save and self._save_pending:
+                self._save_pending = False
+                self.save_data()
+    
+    def create_nodes_batch(self, specs: List[Dict[str, Any]]) -> List[str]:
+        """
+        Crea varios nodos con una sola escritura a disco
+        
+        Args:
+            specs: Lista de dicts con 'name', 'type', 'parent_id' opcional
+                   y campos adicionales de update_node (status, markdown...)
+            
+        Returns:
+            List[str]: IDs de los nodos creados, en el mismo orden
+        """
+        timestamp = datetime.now().isoformat()
+        # Un solo uuid4 por lote: los IDs siguientes se numeran desde él
+        # (mismo formato hex de 32 caracteres, sin leer os.urandom por nodo)
+        base = uuid.uuid4().int
+        
+        # Construir todos los nodos fuera del lock y volcarlos con un update()
+        batch = {}
+        for offset, spec in enumerate(specs):
+            node_id = f"{(base + offset) & _ID_MASK:032x}"
+            node_data = _NODE_TEMPLATE.copy()
+            node_data['id'] = node_id
+            node_data['parent_id'] = spec.get('parent_id')
+            node_data['created_at'] = timestamp
+            for key, value in spec.items():
+                if key in _UPDATABLE_FIELDS:
+                    node_data[key] = value
+            if 'status' in spec:
+                node_data['status'] = intern_status(spec['status'])
+            if not _CREATE_KEYS.issuperset(spec):
+                node_data['updated_at'] = timestamp  # Como un update_node posterior
+            batch[node_id] = node_data
+        
+        with self._lock:
+            self.nodes.update(batch)
+            for node_id, node_data in batch.items():
+                self.node_table.add(node_id, node_data['type'], node_data['status'])
+                parent_id = node_data['parent_id']
+                if parent_id and parent_id in self.nodes:
+                    self._append_child(parent_id, node_id)
+                if not self.root_id:
+                    self.root_id = node_id
+            if self.root_id in batch:
+                self._root_version += 1
+        
+        self._save_or_defer()
+        return list(batch)
+    
+    def _append_child(self, parent_id: str, child_id: str):
+        """Agrega un hijo, creando la lista solo cuando hace falta"""
+        parent_node = self.nodes[parent_id]
+        children = parent_node.get('children')
+        if children:
+            children.append(child_id)
+        else:
+            parent_node['children'] = [child_id]
+        
+        # Los hijos del root forman parte de los datos cacheados de vista previa
+        if parent_id == self.root_id:
+            self._root_version += 1
+    
+    def _remove_child(self, parent_id: str, child_id: str):
+        """Quita un hijo de la lista de su padre, si está"""
+        siblings = self.nodes[parent_id].get('children')
+        if siblings and child_id in siblings:
+            siblings.remove(child_id)
+            if parent_id == self.root_id:
+                self._root_version += 1
+    
+    def create_node(self, name: str, node_type: str, parent_id: Optional[str] = None,
+                    timestamp: Optional[str] = None) -> str:
         """
         Crea un nuevo nodo
         
@@ -71,61 +276,68 @@ class JsonRepository:
             name: Nombre del nodo
             node_type: 'folder' o 'file'
             parent_id: ID del nodo padre (None para nodo raíz)
+            timestamp: Marca ISO ya calculada (evita leer el reloj por nodo)
             
         Returns:
             str: ID del nodo creado
         """
-        node_id = str(uuid.uuid4())
-        
-        node_data = {
-            'id': node_id,
-            'name': name,
-            'type': node_type,
-            'parent_id': parent_id,
-            'status': '⬜',  # Pendiente por defecto
-            'markdown': '',
-            'notes': '',
-            'code': '',
-            'children': [],
-            'created_at': datetime.now().isoformat()
-        }
-        
-        # Agregar al diccionario de nodos
-        self.nodes[node_id] = node_data
+        node_id = uuid.uuid4().hex
         
-        # Si tiene padre, agregarlo a los hijos del padre
-        if parent_id and parent_id in self.nodes:
-            parent_node = self.nodes[parent_id]
-            if 'children' not in parent_node:
-                parent_node['children'] = []
-            parent_node['children'].append(node_id)
+        node_data = _NODE_TEMPLATE.copy()
+        node_data['id'] = node_id
+        node_data['name'] = name
+        node_data['type'] = node_type
+        node_data['parent_id'] = parent_id
+        node_data['created_at'] = timestamp or datetime.now().isoformat()
         
-        # Si no hay root_id, este se convierte en root
-        if not self.root_id:
-            self.root_id = node_id
+        with self._lock:
+            # Agregar al diccionario de nodos
+            self.nodes[node_id] = node_data
+            self.node_table.add(node_id, node_type, node_data['status'])
+            
+            # Si tiene padre, agregarlo a los hijos del padre
+            if parent_id and parent_id in self.nodes:
+                self._append_child(parent_id, node_id)
+            
+            # Si no hay root_id, este se convierte en root
+            if not self.root_id:
+                self.root_id = node_id
         
-        self.save_data()
+        self._save_or_defer()
         return node_id
     
-    def update_node(self, node_id: str, **kwargs):
+    def update_node(self, node_id: str, timestamp: Optional[str] = None, **kwargs):
         """
         Actualiza un nodo existente
         
         Args:
             node_id: ID del nodo a actualizar
+            timestamp: Marca ISO ya calculada (evita leer el reloj por nodo)
             **kwargs: Campos a actualizar
         """
         if node_id in self.nodes:
-            node = self.nodes[node_id]
-            
-            # Actualizar campos válidos
-            valid_fields = ['name', 'type', 'status', 'markdown', 'notes', 'code']
-            for key, value in kwargs.items():
-                if key in valid_fields:
-                    node[key] = value
+            with self._lock:
+                node = self.nodes[node_id]
+                
+                if 'status' in kwargs:
+                    kwargs['status'] = intern_status(kwargs['status'])
+                
+                # Actualizar campos válidos
+                for key, value in kwargs.items():
+                    if key in _UPDATABLE_FIELDS:
+                        node[key] = value
+                
+                if 'type' in kwargs:
+                    self.node_table.set_type(node_id, kwargs['type'])
+                if 'status' in kwargs:
+                    self.node_table.set_status(node_id, kwargs['status'])
+                
+                node['updated_at'] = timestamp or datetime.now().isoformat()
+                
+                if node_id == self.root_id:
+                    self._root_version += 1
             
-            node['updated_at'] = datetime.now().isoformat()
-            self.save_data()
+            self._mark_dirty()
             return True
         
         return False
@@ -143,40 +355,46 @@ class JsonRepository:
         if node_id not in self.nodes:
             return False
         
-        node = self.nodes[node_id]
-        
-        # Eliminar hijos recursivamente
-        children = node.get('children', [])
-        for child_id in children[:]:  # Copia para evitar modificación durante iteración
-            self.delete_node(child_id)
-        
-        # Remover de los hijos del padre
-        parent_id = node.get('parent_id')
-        if parent_id and parent_id in self.nodes:
-            parent_node = self.nodes[parent_id]
-            if 'children' in parent_node and node_id in parent_node['children']:
-                parent_node['children'].remove(node_id)
-        
-        # Eliminar el nodo
-        del self.nodes[node_id]
-        
-        # Si era el root, limpiar root_id
-        if self.root_id == node_id:
-            self.root_id = None
+        with self._lock:
+            node = self.nodes[node_id]
+            
+            # Remover de los hijos del padre (solo la raíz de la rama)
+            parent_id = node.get('parent_id')
+            if parent_id and parent_id in self.nodes:
+                self._remove_child(parent_id, node_id)
+            
+            # Eliminar la rama con una pila explícita: sin recursión ni un
+            # guardado por nodo, y sin sacar cada hijo de una lista que
+            # desaparece con su padre
+            stack = [node_id]
+            while stack:
+                current_id = stack.pop()
+                current = self.nodes.pop(current_id, None)
+                if current is None:
+                    continue
+                
+                children = current.get('children')
+                if children:
+                    stack.extend(children)
+                self.node_table.remove(current_id)
+                
+                # Si era el root, limpiar root_id
+                if self.root_id == current_id:
+                    self.root_id = None
         
-        self.save_data()
+        self._save_or_defer()
         return True
     
     def get_node(self, node_id: str) -> Optional[Dict[str, Any]]:
         """Obtiene un nodo por su ID"""
         return self.nodes.get(node_id)
     
-    def get_children(self, node_id: str) -> List[str]:
-        """Obtiene los IDs de los hijos de un nodo"""
+    def get_children(self, node_id: str) -> Sequence[str]:
+        """Obtiene los IDs de los hijos de un nodo (tupla vacía si no tiene)"""
         node = self.nodes.get(node_id)
         if node:
-            return node.get('children', [])
-        return []
+            return node.get('children', ())
+        return ()
     
     def get_node_count(self) -> int:
         """Obtiene el número total de nodos"""
@@ -184,35 +402,23 @@ class JsonRepository:
     
     def clear_all_data(self):
         """Limpia todos los datos (usar con precaución)"""
-        self.nodes.clear()
-        self.root_id = None
-        self.save_data()
+        with self._lock:
+            self.nodes.clear()
+            self.node_table.clear()
+            self.root_id = None
+            self._root_version += 1
+        self._save_or_defer()
     
     def get_stats(self) -> Dict[str, int]:
         """Obtiene estadísticas de los datos"""
-        stats = {
+        table = self.node_table
+        folders = table.count_type(TypeCode.FOLDER)
+        
+        return {
             'total_nodes': len(self.nodes),
-            'folders': 0,
-            'files': 0,
-            'completed': 0,
-            'pending': 0,
-            'blocked': 0
+            'folders': folders,
+            'files': len(table) - folders,
+            'completed': table.count_status(StatusCode.COMPLETED),
+            'pending': table.count_status(StatusCode.PENDING),
+            'blocked': table.count_status(StatusCode.BLOCKED)
         }
-        
-        for node in self.nodes.values():
-            # Contar por tipo
-            if node.get('type') == 'folder':
-                stats['folders'] += 1
-            else:
-                stats['files'] += 1
-            
-            # Contar por status
-            status = node.get('status', '⬜')
-            if status == '✅':
-                stats['completed'] += 1
-            elif status == '⬜':
-                stats['pending'] += 1
-            elif status == '❌':
-                stats['blocked'] += 1
-        
-        return stats
\ No newline at end of file
@@ -0,0 +1,179 @@
+"""
+infrastructure/persistence/node_table.py
+========================================
+
+Tabla columnar (SoA) de tipo y estado de los nodos
+- Columnas compactas array('B') paralelas a JsonRepository.nodes
+- Contadores por tipo/estado mantenidos en cada mutación (stats O(1))
+- Borrado O(1) intercambiando con la última fila
+"""
+
+import sys
+from array import array
+from enum import IntEnum
+from typing import Dict, Any, List
+
+
+class TypeCode(IntEnum):
+    """Código compacto del tipo de nodo"""
+    FOLDER = 0
+    FILE = 1
+
+
+class StatusCode(IntEnum):
+    """Código compacto del estado de nodo"""
+    PENDING = 0    # ⬜
+    COMPLETED = 1  # ✅
+    BLOCKED = 2    # ❌
+    OTHER = 3
+
+# Emojis de estado internados: los nodos guardan estos mismos objetos
+# y la codificación compara por identidad antes de caer al diccionario
+STATUS_PENDING_EMOJI = sys.intern('⬜')
+STATUS_COMPLETED_EMOJI = sys.intern('✅')
+STATUS_BLOCKED_EMOJI = sys.intern('❌')
+
+_STATUS_CODES = {
+    STATUS_PENDING_EMOJI: StatusCode.PENDING,
+    STATUS_COMPLETED_EMOJI: StatusCode.COMPLETED,
+    STATUS_BLOCKED_EMOJI: StatusCode.BLOCKED
+}
+
+
+def encode_type(node_type: str) -> TypeCode:
+    """Codifica el tipo de nodo ('folder' o cualquier otro = archivo)"""
+    return TypeCode.FOLDER if node_type == 'folder' else TypeCode.FILE
+
+
+def intern_status(status: str) -> str:
+    """Devuelve el objeto compartido para un estado emoji"""
+    return sys.intern(status) if isinstance(status, str) else status
+
+
+def encode_status(status: str) -> StatusCode:
+    """Codifica el estado emoji de un nodo"""
+    if status is STATUS_PENDING_EMOJI:
+        return StatusCode.PENDING
+    if status is STATUS_COMPLETED_EMOJI:
+        return StatusCode.COMPLETED
+    if status is STATUS_BLOCKED_EMOJI:
+        return StatusCode.BLOCKED
+    return _STATUS_CODES.get(status, StatusCode.OTHER)
+
+
+class NodeTable:
+    """Columnas de tipo/estado indexadas por posición de fila"""
+
+    def __init__(self):
+        self.ids: List[str] = []
+        self.id_to_idx: Dict[str, int] = {}
+        self.type_arr = array('B')
+        self.status_arr = array('B')
+        self._type_counts = [0] * len(TypeCode)
+        self._status_counts = [0] * len(StatusCode)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def add(self, node_id: str, node_type: str, status: str = STATUS_PENDING_EMOJI):
+        """Agrega una fila para el nodo"""
+        self.id_to_idx[node_id] = len(self.ids)
+        self.ids.append(node_id)
+        type_code = encode_type(node_type)
+        status_code = encode_status(status)
+        self.type_arr.append(type_code)
+        self.status_arr.append(status_code)
+        self._type_counts[type_code] += 1
+        self._status_counts[status_code] += 1
+
+    def set_type(self, node_id: str, node_type: str):
+        """Actualiza el tipo de un nodo existente"""
+        idx = self.id_to_idx.get(node_id)
+        if idx is not None:
+            type_code = encode_type(node_type)
+            self._type_counts[self.type_arr[idx]] -= 1
+            self._type_counts[type_code] += 1
+            self.type_arr[idx] = type_code
+
+    def set_status(self, node_id: str, status: str):
+        """Actualiza el estado de un nodo existente"""
+        idx = self.id_to_idx.get(node_id)
+        if idx is not None:
+            status_code = encode_status(status)
+            self._status_counts[self.status_arr[idx]] -= 1
+            self._status_counts[status_code] += 1
+            self.status_arr[idx] = status_code
+
+    def remove(self, node_id: str):
+        """Elimina la fila del nodo moviendo la última a su posición"""
+        idx = self.id_to_idx.pop(node_id, None)
+        if idx is None:
+            return
+
+        self._type_counts[self.type_arr[idx]] -= 1
+        self._status_counts[self.status_arr[idx]] -= 1
+
+        last = len(self.ids) - 1
+        if idx != last:
+            last_id = self.ids[last]
+            self.ids[idx] = last_id
+            self.type_arr[idx] = self.type_arr[last]
+            self.status_arr[idx] = self.status_arr[last]
+            self.id_to_idx[last_id] = idx
+
+        self.ids.pop()
+        self.type_arr.pop()
+        self.status_arr.pop()
+
+    def clear(self):
+        """Vacía la tabla"""
+        self.ids.clear()
+        self.id_to_idx.clear()
+        self.type_arr = array('B')
+        self.status_arr = array('B')
+        self._type_counts = [0] * len(TypeCode)
+        self._status_counts = [0] * len(StatusCode)
+
+    def rebuild(self, nodes: Dict[str, Dict[str, Any]], intern_statuses: bool = False):
+        """
+        Reconstruye columnas y contadores en una sola pasada
+
+        Con intern_statuses=True también sustituye en cada nodo su estado por
+        el objeto internado (carga desde disco) sin recorrer los nodos otra vez.
+        """
+        ids = []
+        id_to_idx = {}
+        type_arr = array('B')
+        status_arr = array('B')
+        type_counts = [0] * len(TypeCode)
+        status_counts = [0] * len(StatusCode)
+
+        for idx, (node_id, node) in enumerate(nodes.items()):
+            status = node.get('status')
+            if status is None:
+                status = STATUS_PENDING_EMOJI
+            elif intern_statuses:
+                status = node['status'] = intern_status(status)
+            type_code = encode_type(node.get('type'))
+            status_code = encode_status(status)
+            ids.append(node_id)
+            id_to_idx[node_id] = idx
+            type_arr.append(type_code)
+            status_arr.append(status_code)
+            type_counts[type_code] += 1
+            status_counts[status_code] += 1
+
+        self.ids = ids
+        self.id_to_idx = id_to_idx
+        self.type_arr = type_arr
+        self.status_arr = status_arr
+        self._type_counts = type_counts
+        self._status_counts = status_counts
+
+    def count_type(self, code: TypeCode) -> int:
+        """Cuenta filas con el código de tipo dado"""
+        return self._type_counts[code]
+
+    def count_status(self, code: StatusCode) -> int:
+        """Cuenta filas con el código de estado dado"""
+        return self._status_counts[code]
@@ -8,41 +8,48 @@ Punto de entrada principal de TreeApp v4 Pro
 - Compatibilidad con estructura actual
 """
 
+import logging
 import sys
 import os
-import tkinter as tk
-from tkinter import messagebox
 
 # Agregar el directorio actual al path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+logger = logging.getLogger(__name__)
+
+# Modo detallado: mensajes DEBUG y traza completa de errores
+VERBOSE = os.environ.get("TREEAPP_DEBUG") == "1"
+
 def main():
     """Función principal de la aplicación"""
     
+    # Mensajes de progreso en DEBUG: el arranque normal no escribe en consola
+    logging.basicConfig(level=logging.DEBUG if VERBOSE else logging.WARNING, format="%(message)s")
+    
     try:
-        # Imports principales
-        from domain.events.event_bus import EventBus
-        from infrastructure.persistence.json_repository import JsonRepository
-        from application.services.workspace_manager import WorkspaceManager
+        # MainWindow importa el núcleo (EventBus, JsonRepository, WorkspaceManager)
+        # al construirse; un ImportError allí también llega a este except
         from presentation.main_window import MainWindow
         
-        print("🚀 Iniciando TreeApp v4 Pro...")
+        logger.debug("🚀 Iniciando TreeApp v4 Pro...")
         
         # Inicializar aplicación
         app = MainWindow()
         
-        print("✅ TreeApp v4 Pro iniciado correctamente")
-        print("📁 Interfaz cargada - Funcionalidades FASE 1 y FASE 2 activas")
+        logger.debug("✅ TreeApp v4 Pro iniciado correctamente")
+        logger.debug("📁 Interfaz cargada - Funcionalidades FASE 1 y FASE 2 activas")
         
         # Ejecutar aplicación
         app.run()
         
     except ImportError as e:
         error_msg = f"❌ Error de importación: {e}"
-        print(error_msg)
+        logger.error(error_msg, exc_info=VERBOSE)  # Traza solo en modo detallado
         
         # Mostrar error en ventana si es posible
         try:
+            import tkinter as tk
+            from tkinter import messagebox
             root = tk.Tk()
             root.withdraw()  # Ocultar ventana principal
             messagebox.showerror(
@@ -62,9 +69,11 @@ def main():
         
     except Exception as e:
         error_msg = f"❌ Error inesperado: {e}"
-        print(error_msg)
+        logger.error(error_msg, exc_info=VERBOSE)  # Traza solo en modo detallado
         
         try:
+            import tkinter as tk
+            from tkinter import messagebox
             root = tk.Tk()
             root.withdraw()
             messagebox.showerror(
@@ -9,28 +9,50 @@ Ventana principal básica para probar que todo funciona
 - 150 líneas - Funcional
 """
 
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import tkinter as tk
-from tkinter import ttk, messagebox
-import sys
-import os
+from tkinter import ttk
+from typing import TYPE_CHECKING
 
-# Imports básicos que sabemos que existen
-from domain.events.event_bus import EventBus
-from infrastructure.persistence.json_repository import JsonRepository
-from application.services.workspace_manager import WorkspaceManager
+from presentation.styling.constants.fonts import shared_font
+from shared.config.config_manager import get_config_manager
+
+if TYPE_CHECKING:
+    from domain.events.event_bus import EventBus
+    from infrastructure.persistence.json_repository import JsonRepository
+    from application.services.workspace_manager import WorkspaceManager
+
+logger = logging.getLogger(__name__)
 
 class MainWindow:
     """Ventana principal simplificada para testing"""
     
     def __init__(self):
-        # Inicializar componentes core
-        self.event_bus = EventBus()
-        self.repository = JsonRepository()
-        self.workspace_manager = WorkspaceManager(self.repository, self.event_bus)
+        # Imports del núcleo diferidos hasta crear la ventana
+        from domain.events.event_bus import EventBus
+        from infrastructure.persistence.json_repository import JsonRepository
+        from application.services.workspace_manager import WorkspaceManager
+        
+        # Lectura y parseo del archivo de datos en un hilo aparte, mientras
+        # el hilo principal crea la ventana (Tk debe quedarse en este hilo)
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="LoadData") as pool:
+            repository_future = pool.submit(JsonRepository)
+            
+            # Configurar ventana principal
+            self.root = tk.Tk()
+            self.setup_window()
+            
+            # Inicializar componentes core
+            self.event_bus: "EventBus" = EventBus()
+            self.repository: "JsonRepository" = repository_future.result()
+        self.workspace_manager: "WorkspaceManager" = WorkspaceManager(self.repository, self.event_bus)
         
-        # Configurar ventana principal
-        self.root = tk.Tk()
-        self.setup_window()
+        # Cache de textos generados (se regeneran solo si cambian los datos)
+        self._tree_view_source = None
+        self._tree_view_cache = None
+        self._preview_key = None
         
         # Inicializar workspace (Req. 4, 5)
         self.workspace_info = self.workspace_manager.initialize_workspace_if_needed()
@@ -49,106 +71,141 @@ class MainWindow:
         
         # Color de fondo básico
         self.root.configure(bg="#1e1e1e")  # VS Code dark
+        
+        self.setup_styles()
+    
+    def setup_styles(self):
+        """Fuentes con nombre y estilos ttk compartidos por todos los widgets"""
+        
+        self.fonts = {
+            'title': shared_font(("Segoe UI", 16, "bold")),
+            'header': shared_font(("Segoe UI", 12, "bold")),
+            'status': shared_font(("Segoe UI", 9)),
+            'status_bold': shared_font(("Segoe UI", 9, "bold")),
+            'tree': shared_font(("Consolas", 10)),
+            'preview': shared_font(("Consolas", 9))
+        }
+        
+        self.style = ttk.Style(self.root)
+        self.style.theme_use("clam")  # Respeta colores de fondo personalizados
+        
+        # Frames
+        self.style.configure("Dark.TFrame", background="#1e1e1e")
+        self.style.configure("Panel.TFrame", background="#252526")
+        self.style.configure("Status.TFrame", background="#007acc")
+        
+        # Separadores verticales entre columnas
+        self.style.configure("Column.TSeparator", background="#3c3c3c")
+        
+        # Labels
+        self.style.configure("Dark.TLabel", background="#1e1e1e", foreground="#cccccc")
+        self.style.configure("Panel.TLabel", background="#252526", foreground="#cccccc")
+        self.style.configure("Title.Dark.TLabel", font=self.fonts['title'])
+        self.style.configure("Header.Dark.TLabel", font=self.fonts['header'])
+        self.style.configure("Header.Panel.TLabel", font=self.fonts['header'])
+        self.style.configure("Tree.Panel.TLabel", font=self.fonts['tree'])
+        self.style.configure("Preview.Panel.TLabel", font=self.fonts['preview'])
+        self.style.configure("Status.TLabel", background="#007acc", foreground="white", font=self.fonts['status'])
+        self.style.configure("Bold.Status.TLabel", font=self.fonts['status_bold'])
     
     def setup_basic_ui(self):
         """Configura interfaz básica funcional"""
         
         # Frame principal
-        main_frame = tk.Frame(self.root, bg="#1e1e1e")
+        main_frame = ttk.Frame(self.root, style="Dark.TFrame")
         main_frame.pack(fill="both", expand=True, padx=10, pady=10)
         
         # Título
-        title_label = tk.Label(
+        title_label = ttk.Label(
             main_frame,
             text="🌳 TreeApp v4 Pro - FASE 1 & 2 Testing",
-            font=("Segoe UI", 16, "bold"),
-            bg="#1e1e1e",
-            fg="#cccccc"
+            style="Title.Dark.TLabel"
         )
         title_label.pack(pady=(0, 20))
         
         # Frame para 3 columnas simuladas
-        columns_frame = tk.Frame(main_frame, bg="#1e1e1e")
+        columns_frame = ttk.Frame(main_frame, style="Dark.TFrame")
         columns_frame.pack(fill="both", expand=True)
         
         # Columna 1: Explorador
         self.setup_explorer_column(columns_frame)
         
         # Separador
-        sep1 = tk.Frame(columns_frame, width=2, bg="#3c3c3c")
-        sep1.pack(side="left", fill="y", padx=5)
+        self.create_separator(columns_frame)
         
         # Columna 2: Editor
         self.setup_editor_column(columns_frame)
         
         # Separador
-        sep2 = tk.Frame(columns_frame, width=2, bg="#3c3c3c")
-        sep2.pack(side="left", fill="y", padx=5)
+        self.create_separator(columns_frame)
         
         # Columna 3: Vista Previa
         self.setup_preview_column(columns_frame)
         
-        # Status bar
-        self.setup_status_bar()
+        # Status bar (no esencial para el primer pintado)
+        self.root.after_idle(self.setup_status_bar)
+    
+    def create_separator(self, parent):
+        """Separador vertical con el estilo compartido"""
+        
+        ttk.Separator(parent, orient="vertical", style="Column.TSeparator").pack(
+            side="left", fill="y", padx=5
+        )
     
     def setup_explorer_column(self, parent):
         """Columna explorador básica"""
         
-        explorer_frame = tk.Frame(parent, bg="#252526", relief="solid", bd=1)
+        explorer_frame = ttk.Frame(parent, style="Panel.TFrame", relief="solid", borderwidth=1)
         explorer_frame.pack(side="left", fill="both", expand=True)
         
         # Header
-        header = tk.Label(
+        header = ttk.Label(
             explorer_frame,
             text="TreeCreator",
-            font=("Segoe UI", 12, "bold"),
-            bg="#252526",
-            fg="#cccccc"
+            style="Header.Panel.TLabel"
         )
         header.pack(pady=10)
         
-        # Simular árbol básico
-        tree_text = tk.Text(
+        # Simular árbol básico (texto estático: Label en lugar de Text)
+        tree_label = ttk.Label(
             explorer_frame,
-            bg="#252526",
-            fg="#cccccc",
-            font=("Consolas", 10),
-            height=15,
-            state="disabled"
+            style="Tree.Panel.TLabel",
+            justify="left",
+            anchor="nw"
         )
-        tree_text.pack(fill="both", expand=True, padx=10, pady=(0, 10))
+        tree_label.pack(fill="both", expand=True, padx=10, pady=(0, 10))
+        
+        self.tree_label = tree_label
+        
+        # Mostrar workspace inicial cuando la ventana ya es visible
+        self.root.after_idle(self.fill_explorer_tree)
+    
+    def fill_explorer_tree(self):
+        """Rellena el árbol básico del explorador"""
         
-        # Mostrar workspace inicial
         if self.workspace_info and self.workspace_info['preview_data']:
             tree_content = self.generate_basic_tree_view()
-            tree_text.configure(state="normal")
-            tree_text.insert(1.0, tree_content)
-            tree_text.configure(state="disabled")
-        
-        self.tree_text = tree_text
+            self.tree_label.configure(text=tree_content)
     
     def setup_editor_column(self, parent):
         """Columna editor básica"""
         
-        editor_frame = tk.Frame(parent, bg="#1e1e1e", relief="solid", bd=1)
+        editor_frame = ttk.Frame(parent, style="Dark.TFrame", relief="solid", borderwidth=1)
         editor_frame.pack(side="left", fill="both", expand=True)
         
         # Header
-        header = tk.Label(
+        header = ttk.Label(
             editor_frame,
             text="Documentación",
-            font=("Segoe UI", 12, "bold"),
-            bg="#1e1e1e",
-            fg="#cccccc"
+            style="Header.Dark.TLabel"
         )
         header.pack(pady=10)
         
         # Campo nombre
-        name_label = tk.Label(
+        name_label = ttk.Label(
             editor_frame,
             text="NODO:",
-            bg="#1e1e1e",
-            fg="#cccccc"
+            style="Dark.TLabel"
         )
         name_label.pack(anchor="w", padx=10)
         
@@ -161,11 +218,10 @@ class MainWindow:
         self.name_entry.pack(fill="x", padx=10, pady=(2, 10))
         
         # Campo markdown
-        markdown_label = tk.Label(
+        markdown_label = ttk.Label(
             editor_frame,
             text="MARKDOWN:",
-            bg="#1e1e1e",
-            fg="#cccccc"
+            style="Dark.TLabel"
         )
         markdown_label.pack(anchor="w", padx=10)
         
@@ -178,68 +234,69 @@ class MainWindow:
         )
         self.markdown_text.pack(fill="both", expand=True, padx=10, pady=(2, 10))
         
-        # Cargar datos iniciales
-        self.load_initial_node_data()
+        # Cargar datos iniciales tras mostrar la ventana
+        self.root.after_idle(self.load_initial_node_data)
     
     def setup_preview_column(self, parent):
         """Columna vista previa básica"""
         
-        preview_frame = tk.Frame(parent, bg="#252526", relief="solid", bd=1)
+        preview_frame = ttk.Frame(parent, style="Panel.TFrame", relief="solid", borderwidth=1)
         preview_frame.pack(side="right", fill="both", expand=True)
         
         # Header
-        header = tk.Label(
+        header = ttk.Label(
             preview_frame,
             text="Vista Previa",
-            font=("Segoe UI", 12, "bold"),
-            bg="#252526",
-            fg="#cccccc"
+            style="Header.Panel.TLabel"
         )
         header.pack(pady=10)
         
-        # Vista previa
-        self.preview_text = tk.Text(
+        # Vista previa (solo lectura: Label en lugar de Text)
+        self.preview_label = ttk.Label(
             preview_frame,
-            bg="#252526",
-            fg="#cccccc",
-            font=("Consolas", 9),
-            state="disabled"
+            style="Preview.Panel.TLabel",
+            justify="left",
+            anchor="nw"
         )
-        self.preview_text.pack(fill="both", expand=True, padx=10, pady=(0, 10))
+        self.preview_label.pack(fill="both", expand=True, padx=10, pady=(0, 10))
         
-        # Renderizar vista previa inicial
-        self.render_basic_preview()
+        # Renderizar vista previa inicial tras mostrar la ventana
+        self.root.after_idle(self.render_basic_preview)
     
     def setup_status_bar(self):
         """Barra de estado"""
         
-        status_frame = tk.Frame(self.root, bg="#007acc", height=25)
+        status_frame = ttk.Frame(self.root, style="Status.TFrame", height=25)
         status_frame.pack(fill="x", side="bottom")
         
-        # Stats del workspace
-        stats = self.workspace_manager.get_workspace_stats()
+        # Texto de stats enlazado a una StringVar: se actualiza con set()
+        self.status_var = tk.StringVar(master=self.root)
+        self.update_status_bar()
         
-        status_text = f"📊 Nodos: {stats['total_nodes']} | 📁 Carpetas: {stats['folders']} | 📄 Archivos: {stats['files']} | ✅ Completados: {stats['completed']}"
-        
-        status_label = tk.Label(
+        status_label = ttk.Label(
             status_frame,
-            text=status_text,
-            bg="#007acc",
-            fg="white",
-            font=("Segoe UI", 9)
+            textvariable=self.status_var,
+            style="Status.TLabel"
         )
         status_label.pack(side="left", padx=10)
         
         # Info de testing
-        test_label = tk.Label(
+        test_label = ttk.Label(
             status_frame,
             text="🧪 MODO TESTING - FASE 1 & 2",
-            bg="#007acc",
-            fg="white",
-            font=("Segoe UI", 9, "bold")
+            style="Bold.Status.TLabel"
         )
         test_label.pack(side="right", padx=10)
     
+    def update_status_bar(self):
+        """Actualiza las stats de la barra de estado"""
+        
+        stats = self.workspace_manager.get_workspace_stats()
+        
+        self.status_var.set(
+            f"📊 Nodos: {stats['total_nodes']} | 📁 Carpetas: {stats['folders']} | 📄 Archivos: {stats['files']} | ✅ Completados: {stats['completed']}"
+        )
+    
     def generate_basic_tree_view(self):
         """Genera vista básica del árbol"""
         
@@ -248,6 +305,10 @@ class MainWindow:
         
         data = self.workspace_info['preview_data']
         
+        # preview_data se reemplaza por un dict nuevo cuando cambia el root
+        if data is self._tree_view_source:
+            return self._tree_view_cache
+        
         tree_view = f"""📁 {data['name']} {data['status']}
     {data['markdown']}
 
@@ -263,6 +324,8 @@ class MainWindow:
 - Agregar archivos VS Code faltantes
 - Continuar con FASE 3"""
         
+        self._tree_view_source = data
+        self._tree_view_cache = tree_view
         return tree_view
     
     def load_initial_node_data(self):
@@ -283,11 +346,18 @@ class MainWindow:
         """Renderiza vista previa básica"""
         
         stats = self.workspace_manager.get_workspace_stats()
+        tree_view = self.generate_basic_tree_view()
+        
+        # Sin cambios en árbol ni estadísticas: el texto mostrado sigue vigente
+        preview_key = (tree_view, tuple(stats.values()))
+        if preview_key == self._preview_key:
+            return
+        self._preview_key = preview_key
         
         preview_content = f"""📁 Vista Previa - Modo Testing
 
 ═══ WORKSPACE INICIAL ═══
-{self.generate_basic_tree_view()}
+{tree_view}
 
 ═══ ESTADÍSTICAS ═══
 Total nodos: {stats['total_nodes']}
@@ -308,10 +378,7 @@ Bloqueados ❌: {stats['blocked']}
 2. Activar vista previa completa
 3. Probar funcionalidades FASE 1 & 2"""
         
-        self.preview_text.configure(state="normal")
-        self.preview_text.delete(1.0, "end")
-        self.preview_text.insert(1.0, preview_content)
-        self.preview_text.configure(state="disabled")
+        self.preview_label.configure(text=preview_content)
     
     def setup_events(self):
         """Configurar eventos básicos"""
@@ -325,20 +392,32 @@ Bloqueados ❌: {stats['blocked']}
     
     def on_test_event(self, data):
         """Handler de prueba para EventBus"""
-        print(f"✅ EventBus funcionando: {data}")
+        logger.debug("✅ EventBus funcionando: %s", data)
     
     def on_closing(self):
         """Manejo del cierre de la aplicación"""
         
-        try:
-            self.repository.save_data()
-            print("💾 Datos guardados correctamente")
-        except Exception as e:
-            print(f"⚠️ Error guardando datos: {e}")
+        # Guardado final fuera del hilo de la UI; el hilo no es daemon,
+        # así que termina de escribir aunque la ventana ya se haya cerrado
+        saver = threading.Thread(target=self._save_on_exit, name="SaveOnExit")
+        saver.start()
+        saver.join(2.0)
         
         self.root.destroy()
     
+    def _save_on_exit(self):
+        """Guardado final de datos al cerrar"""
+        
+        try:
+            # Detiene el hilo de escritura diferida y guarda lo pendiente
+            self.repository.close()
+            # Estado de ventana/paneles que aún espera en el Timer de la config
+            get_config_manager().flush()
+            logger.debug("💾 Datos guardados correctamente")
+        except Exception as e:
+            logger.warning("⚠️ Error guardando datos: %s", e)
+    
     def run(self):
         """Ejecutar la aplicación"""
-        print("🎮 Iniciando interfaz gráfica...")
+        logger.debug("🎮 Iniciando interfaz gráfica...")
         self.root.mainloop()
\ No newline at end of file
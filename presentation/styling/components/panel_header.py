@@ -12,6 +12,7 @@ Headers unificados para paneles estilo VS Code
 import tkinter as tk
 from tkinter import ttk
 from ..constants.vscode_colors import VSCodeColors
+from ..constants.fonts import shared_font
 
 class PanelHeader(tk.Frame):
     """Header unificado para paneles estilo VS Code"""
@@ -38,7 +39,7 @@ class PanelHeader(tk.Frame):
         self.title_label = tk.Label(
             self,
             text=self.title,
-            font=("Segoe UI", 12, "bold"),
+            font=shared_font(("Segoe UI", 12, "bold")),
             bg=VSCodeColors.BACKGROUND,
             fg=VSCodeColors.TEXT_PRIMARY,
             anchor="w"
@@ -65,7 +66,7 @@ class PanelHeader(tk.Frame):
             text=config.get('text', ''),
             command=config.get('command', None),
             width=config.get('width', 3),
-            font=("Segoe UI", 9),
+            font=shared_font(("Segoe UI", 9)),
             bg=VSCodeColors.SIDEBAR,
             fg=VSCodeColors.TEXT_PRIMARY,
             activebackground=VSCodeColors.HOVER,
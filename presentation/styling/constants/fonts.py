@@ -43,4 +43,53 @@ HEADER_FONT = ("Segoe UI", 12, "bold")       # Headers de paneles
 
 DEFAULT = UI_FONT                            # Fuente por defecto
 MONOSPACE = CODE_FONT                        # Fuente monospace
-HEADER = TITLE_FONT                          # Headers
\ No newline at end of file
+HEADER = TITLE_FONT                          # Headers
+# ═══════════════════════════════════════════════════════════════
+# OBJETOS FONT COMPARTIDOS
+# ═══════════════════════════════════════════════════════════════
+
+_FONT_CACHE = {}
+_ROLE_FONTS = {}
+
+def _make_font(spec):
+    """Crea un tkfont.Font a partir de una tupla (familia, tamaño[, estilos])"""
+    from tkinter import font as tkfont
+    family, size, *styles = spec
+    return tkfont.Font(
+        family=family,
+        size=size,
+        weight="bold" if "bold" in styles else "normal",
+        slant="italic" if "italic" in styles else "roman"
+    )
+
+def shared_font(spec):
+    """
+    Devuelve un tkfont.Font compartido para una tupla (familia, tamaño[, estilos])
+    
+    Tk resuelve la fuente una sola vez y todos los widgets la referencian
+    por nombre. Requiere que la ventana raíz ya exista.
+    """
+    font = _FONT_CACHE.get(spec)
+    if font is None:
+        font = _make_font(spec)
+        _FONT_CACHE[spec] = font
+    return font
+
+def role_font(role, spec):
+    """
+    Devuelve la fuente propia de un rol (p. ej. 'editor_code'), creada con spec
+    
+    A diferencia de shared_font, su tamaño puede cambiarse con
+    set_role_font_size sin afectar a otros paneles.
+    """
+    font = _ROLE_FONTS.get(role)
+    if font is None:
+        font = _make_font(spec)
+        _ROLE_FONTS[role] = font
+    return font
+
+def set_role_font_size(role, size):
+    """Cambia el tamaño de un rol: Tk lo propaga a todos sus widgets"""
+    font = _ROLE_FONTS.get(role)
+    if font is not None:
+        font.configure(size=size)
@@ -6,6 +6,7 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 from typing import Optional
 from domain.node.node_entity import Node
+from presentation.styling.constants.fonts import shared_font, role_font, set_role_font_size
 
 
 class EditorContainer:
@@ -19,6 +20,8 @@ class EditorContainer:
         self.auto_save_timer = None
         self.tree_update_callback = None  # Callback para actualizar TreeView
         self._loading = False  # Flag para evitar callbacks durante carga
+        self._loaded_text = {}  # Text -> último valor cargado por código
+        self._line_count = 0  # Líneas numeradas actualmente en line_numbers
         self._setup_ui()
     
     def set_tree_update_callback(self, callback):
@@ -60,7 +63,7 @@ class EditorContainer:
         title_label = tk.Label(
             header_frame,
             text="📝 Documentación",
-            font=('Arial', 14, 'bold'),
+            font=shared_font(('Arial', 14, 'bold')),
             bg='#ecf0f1',
             fg='#2c3e50'
         )
@@ -73,7 +76,7 @@ class EditorContainer:
         # Entry para el nombre
         self.name_entry = tk.Entry(
             frame,
-            font=('Arial', 11),
+            font=shared_font(('Arial', 11)),
             relief=tk.FLAT,
             bg='#ffffff',
             fg='#2c3e50',
@@ -84,12 +87,12 @@ class EditorContainer:
         
         # EVENTOS MÚLTIPLES PARA CAPTURAR CAMBIOS EN TIEMPO REAL
         self.name_entry.bind('<KeyRelease>', self._on_name_change)      # Cada tecla
-        self.name_entry.bind('<KeyPress>', self._on_name_change_delayed) # Antes de escribir
         self.name_entry.bind('<FocusOut>', self._on_name_change)        # Al perder foco
         self.name_entry.bind('<Return>', self._on_name_change)          # Enter
         self.name_entry.bind('<Tab>', self._on_name_change)             # Tab
         
-        # Trace para capturar TODOS los cambios (incluso pegado)
+        # Trace para capturar TODOS los cambios (incluso pegado); se dispara
+        # de forma síncrona, sin reprogramar nada con after()
         self.name_var = tk.StringVar()
         self.name_entry.config(textvariable=self.name_var)
         self.name_var.trace('w', self._on_name_trace)  # Trace en la variable
@@ -102,7 +105,7 @@ class EditorContainer:
         self.markdown_text = tk.Text(
             frame,
             height=2,
-            font=('Consolas', 10),
+            font=role_font('editor_markdown', ('Consolas', 10)),
             relief=tk.FLAT,
             bg='#ffffff',
             fg='#2c3e50',
@@ -123,7 +126,7 @@ class EditorContainer:
         
         self.notes_text = tk.Text(
             text_container,
-            font=('Arial', 10),
+            font=role_font('editor_notes', ('Arial', 10)),
             relief=tk.FLAT,
             bg='#ffffff',
             fg='#2c3e50',
@@ -157,7 +160,7 @@ class EditorContainer:
         self.line_numbers = tk.Text(
             code_frame,
             width=4,
-            font=('Consolas', 9),
+            font=role_font('editor_code', ('Consolas', 9)),
             relief=tk.FLAT,
             bg='#f8f9fa',
             fg='#7f8c8d',
@@ -169,7 +172,7 @@ class EditorContainer:
         # Text widget para código
         self.code_text = tk.Text(
             code_frame,
-            font=('Consolas', 9),
+            font=role_font('editor_code', ('Consolas', 9)),
             relief=tk.FLAT,
             bg='#ffffff',
             fg='#2c3e50',
@@ -214,7 +217,7 @@ class EditorContainer:
             command=self._add_to_project,
             bg='#f39c12', 
             fg='white', 
-            font=('Arial', 9, 'bold'), 
+            font=shared_font(('Arial', 9, 'bold')), 
             relief=tk.FLAT,
             pady=5
         ).pack(side=tk.RIGHT)
@@ -233,7 +236,7 @@ class EditorContainer:
         title_label = tk.Label(
             header_frame,
             text=title,
-            font=('Arial', 9, 'bold'),
+            font=shared_font(('Arial', 9, 'bold')),
             bg='#bdc3c7',
             fg='#2c3e50'
         )
@@ -253,19 +256,26 @@ class EditorContainer:
         self._update_line_numbers()
     
     def _update_line_numbers(self, event=None):
-        """Actualizar numeración de líneas."""
-        # Obtener contenido del código
-        content = self.code_text.get('1.0', tk.END)
-        lines = content.split('\n')
-        
-        # Generar números de línea
-        line_numbers_content = '\n'.join(str(i) for i in range(1, len(lines)))
+        """Actualizar numeración de líneas (solo añade o recorta la diferencia)."""
+        # Número de líneas del código sin leer su contenido
+        count = int(self.code_text.index('end-1c').split('.')[0])
+        if count == self._line_count:
+            return
         
         # Actualizar widget de numeración
         self.line_numbers.config(state=tk.NORMAL)
-        self.line_numbers.delete('1.0', tk.END)
-        self.line_numbers.insert('1.0', line_numbers_content)
+        if count > self._line_count:
+            new_numbers = '\n'.join(map(str, range(self._line_count + 1, count + 1)))
+            self.line_numbers.insert(tk.END, ('\n' if self._line_count else '') + new_numbers)
+        else:
+            self.line_numbers.delete(f'{count}.end', tk.END)
         self.line_numbers.config(state=tk.DISABLED)
+        self._line_count = count
+    
+    def set_font_size(self, size: int):
+        """Cambiar el tamaño de letra de los campos de texto (un configure por fuente)."""
+        for role in ('editor_markdown', 'editor_notes', 'editor_code'):
+            set_role_font_size(role, size)
     
     # ==================== CARGA Y LIMPIEZA ====================
     
@@ -277,18 +287,13 @@ class EditorContainer:
         self._loading = True
         
         # Cargar nombre usando StringVar para evitar eventos
-        self.name_var.set(node.name)
-        
-        self.markdown_text.delete('1.0', tk.END)
-        self.markdown_text.insert('1.0', node.markdown_short)
+        if self.name_var.get() != node.name:
+            self.name_var.set(node.name)
         
-        self.notes_text.delete('1.0', tk.END)
-        self.notes_text.insert('1.0', node.explanation)
-        
-        self.code_text.delete('1.0', tk.END)
-        self.code_text.insert('1.0', node.code)
-        
-        self._update_line_numbers()
+        self._set_text(self.markdown_text, node.markdown_short)
+        self._set_text(self.notes_text, node.explanation)
+        if self._set_text(self.code_text, node.code):
+            self._update_line_numbers()
         
         # Activar callbacks después de cargar
         self._loading = False
@@ -301,13 +306,33 @@ class EditorContainer:
         self._loading = True
         
         self.name_var.set("")
-        self.markdown_text.delete('1.0', tk.END)
-        self.notes_text.delete('1.0', tk.END)
-        self.code_text.delete('1.0', tk.END)
-        
-        self._update_line_numbers()
+        self._set_text(self.markdown_text, "")
+        self._set_text(self.notes_text, "")
+        if self._set_text(self.code_text, ""):
+            self._update_line_numbers()
         self._loading = False
     
+    def _set_text(self, widget: tk.Text, value: str) -> bool:
+        """Reemplazar el contenido solo si difiere; devuelve True si lo escribió."""
+        # El flag 'modified' de Tk indica si el usuario editó desde la última carga
+        if not widget.edit_modified() and self._loaded_text.get(widget) == value:
+            return False
+        
+        widget.delete('1.0', tk.END)
+        widget.insert('1.0', value)
+        widget.edit_modified(False)
+        self._loaded_text[widget] = value
+        return True
+    
+    def _take_edit(self, widget: tk.Text) -> bool:
+        """Consumir el flag 'modified' del Text; True si el usuario lo editó."""
+        if not widget.edit_modified():
+            return False
+        
+        widget.edit_modified(False)
+        self._loaded_text[widget] = widget.get('1.0', 'end-1c')
+        return True
+    
     # ==================== AUTO-SAVE EN TIEMPO REAL ====================
     
     def _schedule_auto_save(self):
@@ -326,11 +351,14 @@ class EditorContainer:
             return
         
         try:
-            # Actualizar nodo con los cambios
+            # Actualizar nodo con los cambios; los Text sin editar se dejan como están
             self.current_node.name = self.name_var.get()
-            self.current_node.markdown_short = self.markdown_text.get('1.0', tk.END).strip()
-            self.current_node.explanation = self.notes_text.get('1.0', tk.END).strip()
-            self.current_node.code = self.code_text.get('1.0', tk.END).strip()
+            if self._take_edit(self.markdown_text):
+                self.current_node.markdown_short = self.markdown_text.get('1.0', tk.END).strip()
+            if self._take_edit(self.notes_text):
+                self.current_node.explanation = self.notes_text.get('1.0', tk.END).strip()
+            if self._take_edit(self.code_text):
+                self.current_node.code = self.code_text.get('1.0', tk.END).strip()
             self.current_node.update_modified()
             
             # Guardar en repositorio
@@ -366,24 +394,24 @@ class EditorContainer:
         # El trace ya maneja todo, pero mantenemos por si acaso
         pass
     
-    def _on_name_change_delayed(self, event=None):
-        """Callback para capturar cambios antes de escribir."""
-        # Programar actualización para después del evento de escritura
-        if not self._loading and self.current_node:
-            self.parent_frame.after(10, self._on_name_trace)
+    # KeyRelease también llega con flechas, Shift o Ctrl+C: solo el flag
+    # 'modified' de Tk indica que el contenido cambió desde el último guardado
     
     def _on_markdown_change(self, event=None):
         """Callback cuando cambia el markdown."""
-        if self.current_node and not self._loading:
+        if self.current_node and not self._loading and self.markdown_text.edit_modified():
             self._schedule_auto_save()
     
     def _on_notes_change(self, event=None):
         """Callback cuando cambian las notas."""
-        if self.current_node and not self._loading:
+        if self.current_node and not self._loading and self.notes_text.edit_modified():
             self._schedule_auto_save()
     
     def _on_code_change(self, event=None):
         """Callback cuando cambia el código."""
+        if not self.code_text.edit_modified():
+            return
+        
         self._update_line_numbers()
         if self.current_node and not self._loading:
             self._schedule_auto_save()
@@ -401,10 +429,13 @@ class EditorContainer:
         print("➕ Procesando código para agregar al proyecto...")
         print(f"Código a procesar:\n{code_content}")
         
+        # Contar saltos de línea sin materializar la lista de líneas
+        line_count = code_content.count('\n') + 1
+        
         # TODO: Implementar parser y creación de estructura
         messagebox.showinfo("Próximamente", 
                           f"Funcionalidad para agregar estructura al proyecto:\n\n"
-                          f"Líneas de código: {len(code_content.splitlines())}\n"
+                          f"Líneas de código: {line_count}\n"
                           f"Caracteres: {len(code_content)}")
         
         # Aquí se implementará el parser de estructura y creación de nodos
\ No newline at end of file
@@ -189,19 +189,16 @@ class TXTExporter:
     def _generate_final_statistics(self, nodes: Dict[str, Any]) -> str:
         """Genera estadísticas finales de la exportación"""
         
-        # Contar por tipo
-        folders = sum(1 for node in nodes.values() if node.get('type') == 'folder')
+        # Contar por tipo, estado y contenido en una sola pasada
+        counts = self._count_nodes(nodes)
+        folders = counts['folders']
         files = len(nodes) - folders
-        
-        # Contar por estado
-        completed = sum(1 for node in nodes.values() if node.get('status') == '✅')
-        pending = sum(1 for node in nodes.values() if node.get('status') == '⬜')
-        blocked = sum(1 for node in nodes.values() if node.get('status') == '❌')
-        
-        # Contar contenido
-        with_notes = sum(1 for node in nodes.values() if node.get('notes', '').strip())
-        with_code = sum(1 for node in nodes.values() if node.get('code', '').strip())
-        with_markdown = sum(1 for node in nodes.values() if node.get('markdown', '').strip())
+        completed = counts['✅']
+        pending = counts['⬜']
+        blocked = counts['❌']
+        with_notes = counts['notes']
+        with_code = counts['code']
+        with_markdown = counts['markdown']
         
         stats = f"""
 {'='*80}
@@ -235,6 +232,26 @@ Exportado por TreeApp v4 Pro - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 
         return stats
     
+    @staticmethod
+    def _count_nodes(nodes: Dict[str, Any]) -> Dict[str, int]:
+        """Cuenta carpetas, estados y campos con contenido recorriendo los nodos una vez"""
+        
+        counts = {'folders': 0, 'notes': 0, 'code': 0, 'markdown': 0}
+        by_status = {'✅': 0, '⬜': 0, '❌': 0}
+        
+        for node in nodes.values():
+            if node.get('type') == 'folder':
+                counts['folders'] += 1
+            status = node.get('status')
+            if status in by_status:
+                by_status[status] += 1
+            for field in ('notes', 'code', 'markdown'):
+                if node.get(field, '').strip():
+                    counts[field] += 1
+        
+        counts.update(by_status)
+        return counts
+    
     def set_export_options(self, options: Dict[str, Any]):
         """Establece opciones de exportación"""
         self.export_config.update(options)
@@ -243,15 +260,20 @@ Exportado por TreeApp v4 Pro - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
         """Genera vista previa de la exportación (primeras líneas)"""
         
         full_content = self.generate_export_content(nodes, root_id, config)
-        lines = full_content.split('\n')
         
-        if len(lines) <= max_lines:
+        # Contar y cortar en C (count/find) sin partir todo el texto en líneas
+        total_lines = full_content.count('\n') + 1
+        max_lines = max(max_lines, 0)
+        if total_lines <= max_lines:
             return full_content
+        if not max_lines:
+            return f"\n... ({total_lines} líneas más) ..."
         
-        preview_lines = lines[:max_lines]
-        preview_lines.append(f"\n... ({len(lines) - max_lines} líneas más) ...")
+        cut = -1
+        for _ in range(max_lines):
+            cut = full_content.find('\n', cut + 1)
         
-        return '\n'.join(preview_lines)
+        return f"{full_content[:cut]}\n\n... ({total_lines - max_lines} líneas más) ..."
     
     def validate_export_data(self, nodes: Dict[str, Any], root_id: str) -> tuple[bool, str]:
         """Valida los datos antes de exportar"""
@@ -289,13 +311,12 @@ Exportado por TreeApp v4 Pro - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
         else:
             export_nodes = nodes
         
-        # Contar elementos
-        folders = sum(1 for node in export_nodes.values() if node.get('type') == 'folder')
+        # Contar elementos y contenido en una sola pasada
+        counts = self._count_nodes(export_nodes)
+        folders = counts['folders']
         files = len(export_nodes) - folders
-        
-        # Contar contenido
-        with_notes = sum(1 for node in export_nodes.values() if node.get('notes', '').strip())
-        with_code = sum(1 for node in export_nodes.values() if node.get('code', '').strip())
+        with_notes = counts['notes']
+        with_code = counts['code']
         
         return {
             'total_nodes': len(export_nodes),
@@ -313,12 +334,16 @@ Exportado por TreeApp v4 Pro - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
         
         branch_nodes = {}
         
-        def collect_nodes(node_id: str):
-            if node_id in nodes:
-                branch_nodes[node_id] = nodes[node_id]
-                children = nodes[node_id].get('children', [])
-                for child_id in children:
-                    collect_nodes(child_id)
+        # Recorrido con pila explícita (sin una llamada recursiva por nodo);
+        # los hijos se apilan invertidos para conservar el orden en preorden
+        stack = [branch_id]
+        while stack:
+            node_id = stack.pop()
+            node = nodes.get(node_id)
+            if node is not None:
+                branch_nodes[node_id] = node
+                children = node.get('children')
+                if children:
+                    stack.extend(reversed(children))
         
-        collect_nodes(branch_id)
         return branch_nodes
\ No newline at end of file
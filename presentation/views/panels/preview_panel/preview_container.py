@@ -15,9 +15,9 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 from typing import Dict, List, Optional, Any
 from datetime import datetime
-import json
 
 from ....styling.constants.vscode_colors import VSCodeColors
+from ....styling.constants.fonts import shared_font
 from .renderers.classic_renderer import ClassicRenderer
 from .renderers.ascii_renderer import ASCIIRenderer
 from .renderers.folders_renderer import FoldersOnlyRenderer
@@ -42,6 +42,8 @@ class PreviewContainer(tk.Frame):
         self.config_visible = False     # Estado del panel de configuración
         self.current_mode = "classic"   # Modo actual
         self.preview_config = {}        # Configuración por modo
+        self.render_delay = 150         # ms para agrupar cambios seguidos
+        self.render_timer = None        # Render pendiente (after id)
         
         # Renderers para los 4 modos
         self.renderers = {
@@ -102,7 +104,7 @@ class PreviewContainer(tk.Frame):
         self.title_label = tk.Label(
             self.header_frame,
             text="Vista Previa",
-            font=("Segoe UI", 12, "bold"),
+            font=shared_font(("Segoe UI", 12, "bold")),
             bg=VSCodeColors.BACKGROUND,
             fg=VSCodeColors.TEXT_PRIMARY
         )
@@ -147,7 +149,7 @@ class PreviewContainer(tk.Frame):
             text="Modo:",
             bg=VSCodeColors.BACKGROUND,
             fg=VSCodeColors.TEXT_PRIMARY,
-            font=("Segoe UI", 9)
+            font=shared_font(("Segoe UI", 9))
         ).pack(side="left")
         
         self.mode_var = tk.StringVar(value="Clásico")
@@ -180,10 +182,9 @@ class PreviewContainer(tk.Frame):
         self.preview_text = tk.Text(
             self.preview_frame,
             wrap="none",
-            state="disabled",
             bg=VSCodeColors.INPUT_BACKGROUND,
             fg=VSCodeColors.TEXT_PRIMARY,
-            font=("Consolas", 9),
+            font=shared_font(("Consolas", 9)),
             relief='flat',
             borderwidth=1
         )
@@ -194,6 +195,11 @@ class PreviewContainer(tk.Frame):
         
         self.preview_text.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
         
+        # Solo lectura por bindings: el contenido se reemplaza sin alternar state
+        self.preview_text.bind("<Key>", self._block_edit_key)
+        for sequence in ("<<Paste>>", "<<Cut>>", "<<Clear>>", "<<PasteSelection>>"):
+            self.preview_text.bind(sequence, lambda e: "break")
+        
         # Pack scrollbars y text
         v_scrollbar.pack(side="right", fill="y")
         h_scrollbar.pack(side="bottom", fill="x")
@@ -206,7 +212,7 @@ class PreviewContainer(tk.Frame):
         config_title = tk.Label(
             self.config_content,
             text="⚙️ Configuración",
-            font=("Segoe UI", 10, "bold"),
+            font=shared_font(("Segoe UI", 10, "bold")),
             bg=VSCodeColors.BACKGROUND,
             fg=VSCodeColors.TEXT_PRIMARY
         )
@@ -413,14 +419,37 @@ class PreviewContainer(tk.Frame):
             )
             
             # Mostrar en el text widget
-            self.preview_text.configure(state="normal")
-            self.preview_text.delete(1.0, "end")
-            self.preview_text.insert(1.0, content)
-            self.preview_text.configure(state="disabled")
+            self._set_preview_content(content)
             
         except Exception as e:
             self.show_error_preview(str(e))
     
+    def _set_preview_content(self, content: str):
+        """Reemplaza el texto de la vista previa en una sola llamada a Tk"""
+        # Muchos cambios (notas, código) no alteran el render: si el texto es el
+        # mismo no se reescribe el widget y el scroll del usuario se conserva.
+        # Se compara con el propio widget, no con una copia del último texto
+        if content == self.preview_text.get("1.0", "end-1c"):
+            return
+        
+        self.preview_text.replace("1.0", "end", content)
+    
+    _NAVIGATION_KEYS = frozenset(("Up", "Down", "Left", "Right", "Prior", "Next", "Home", "End"))
+    # Copiar (Ctrl+C, Ctrl+Insert) y seleccionar todo (Ctrl+A); otros Ctrl+tecla
+    # de Tk editan el texto (Ctrl+K, Ctrl+D, Ctrl+H, Ctrl+O, Ctrl+T, Ctrl+I...)
+    _CONTROL_KEYS = frozenset(("c", "a", "Insert"))
+    
+    @classmethod
+    def _block_edit_key(cls, event):
+        """Bloquea la escritura; deja pasar navegación, copiar y seleccionar todo"""
+        if event.keysym in cls._NAVIGATION_KEYS:
+            return None
+        if event.state & 0x4:
+            keysym = event.keysym if len(event.keysym) > 1 else event.keysym.lower()
+            if keysym in cls._CONTROL_KEYS:
+                return None
+        return "break"
+    
     def show_empty_preview(self):
         """Muestra mensaje cuando no hay datos"""
         
@@ -432,10 +461,7 @@ No hay nodos para mostrar.
 Agrega carpetas y archivos al explorador
 para ver la estructura aquí."""
         
-        self.preview_text.configure(state="normal")
-        self.preview_text.delete(1.0, "end")
-        self.preview_text.insert(1.0, content)
-        self.preview_text.configure(state="disabled")
+        self._set_preview_content(content)
     
     def show_error_preview(self, error_msg: str):
         """Muestra error en la vista previa"""
@@ -448,10 +474,7 @@ para ver la estructura aquí."""
 Modo: {self.current_mode}
 Configuración: {self.preview_config}"""
         
-        self.preview_text.configure(state="normal")
-        self.preview_text.delete(1.0, "end")
-        self.preview_text.insert(1.0, content)
-        self.preview_text.configure(state="disabled")
+        self._set_preview_content(content)
     
     def export_preview(self):
         """Exportar vista previa a TXT"""
@@ -484,5 +507,17 @@ Configuración: {self.preview_config}"""
                 messagebox.showerror("Error", f"Error al exportar:\n{str(e)}")
     
     def on_data_changed(self, data=None):
-        """Maneja cambios en los datos"""
+        """Maneja cambios en los datos (agrupa ráfagas, p. ej. al teclear)"""
+        self._schedule_render()
+    
+    def _schedule_render(self):
+        """Programar render; cada cambio nuevo reinicia la espera"""
+        if self.render_timer:
+            self.after_cancel(self.render_timer)
+        
+        self.render_timer = self.after(self.render_delay, self._deferred_render)
+    
+    def _deferred_render(self):
+        """Render programado por _schedule_render"""
+        self.render_timer = None
         self.render_preview()
\ No newline at end of file
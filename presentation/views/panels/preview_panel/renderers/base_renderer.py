@@ -12,6 +12,9 @@ Clase base abstracta para todos los renderers
 from abc import ABC, abstractmethod
 from typing import Dict, List, Optional, Any
 
+# Icono por tipo de nodo (cualquier tipo desconocido se muestra como archivo)
+NODE_TYPE_ICONS = {'folder': "📁", 'file': "📄"}
+
 class BaseRenderer(ABC):
     """Clase base abstracta para renderers de vista previa"""
     
@@ -57,8 +60,7 @@ class BaseRenderer(ABC):
     def get_node_icon(self, node: Dict[str, Any]) -> str:
         """Obtiene el icono apropiado para un nodo"""
         
-        node_type = node.get('type', 'file')
-        return "📁" if node_type == 'folder' else "📄"
+        return NODE_TYPE_ICONS.get(node.get('type'), "📄")
     
     def truncate_text(self, text: str, max_length: int) -> str:
         """Trunca texto si excede la longitud máxima"""
@@ -102,11 +104,29 @@ class BaseRenderer(ABC):
         
         return counts
     
+    def _count_nodes(self, nodes: Dict[str, Any]):
+        """Cuenta por tipo y por estado en una sola pasada sobre los nodos"""
+        
+        type_counts = {'folders': 0, 'files': 0, 'total': len(nodes)}
+        status_counts = {'completed': 0, 'pending': 0, 'blocked': 0}
+        status_keys = {'✅': 'completed', '⬜': 'pending', '❌': 'blocked'}
+        
+        for node in nodes.values():
+            if node.get('type', 'file') == 'folder':
+                type_counts['folders'] += 1
+            else:
+                type_counts['files'] += 1
+            
+            status_key = status_keys.get(node.get('status', '⬜'))
+            if status_key:
+                status_counts[status_key] += 1
+        
+        return type_counts, status_counts
+    
     def generate_statistics(self, nodes: Dict[str, Any]) -> str:
         """Genera estadísticas de la estructura"""
         
-        type_counts = self.count_nodes_by_type(nodes)
-        status_counts = self.count_nodes_by_status(nodes)
+        type_counts, status_counts = self._count_nodes(nodes)
         
         stats = f"""
 ═══ ESTADÍSTICAS ═══
@@ -2,10 +2,24 @@
 """
 Renderizador para modo ASCII solo carpetas de vista previa.
 """
+from functools import lru_cache
 from typing import List, Dict, Any
 from domain.node.node_entity import Node
 
 
+@lru_cache(maxsize=8192)
+def _markdown_summary(markdown: str, max_length: int) -> str:
+    """Resumen de una línea del markdown (sin # iniciales, truncado)."""
+    md_text = markdown.strip()
+    # Remover # del markdown para display más limpio
+    if md_text.startswith('#'):
+        md_text = md_text.lstrip('#').strip()
+    
+    if len(md_text) > max_length:
+        md_text = md_text[:max_length] + "..."
+    return md_text
+
+
 class FoldersRenderer:
     """Renderizador para vista previa solo carpetas con markdown y estado."""
     
@@ -37,9 +51,14 @@ class FoldersRenderer:
     def _render_folder_node(self, node: Node, lines: List[str], prefix: str, is_last: bool, config: Dict[str, Any]):
         """Renderizar solo nodos de tipo carpeta con información extendida."""
         if node.is_folder():
-            # Contar archivos en esta carpeta
-            children = self.node_repository.find_children(node.node_id)
-            file_count = len([child for child in children if child.is_file()])
+            # Separar subcarpetas y contar archivos en una sola pasada
+            folders = []
+            file_count = 0
+            for child in self.node_repository.find_children(node.node_id):
+                if child.is_folder():
+                    folders.append(child)
+                elif child.is_file():
+                    file_count += 1
             
             # Caracteres ASCII
             branch = "├── " if not is_last else "└── "
@@ -58,18 +77,11 @@ class FoldersRenderer:
             if node.status.value:
                 status_info = f" {node.status.value}"
             
-            # Markdown de la carpeta
+            # Markdown de la carpeta: cada refresco vuelve a pintar las mismas
+            # carpetas, así que el resumen se memoiza por (texto, longitud)
             markdown_info = ""
             if node.markdown_short:
-                md_text = node.markdown_short.strip()
-                # Remover # del markdown para display más limpio
-                if md_text.startswith('#'):
-                    md_text = md_text.lstrip('#').strip()
-                
-                max_length = config.get('markdown_max_length', 40)
-                if len(md_text) > max_length:
-                    md_text = md_text[:max_length] + "..."
-                
+                md_text = _markdown_summary(node.markdown_short, config.get('markdown_max_length', 40))
                 if md_text:
                     markdown_info = f" - {md_text}"
             
@@ -77,10 +89,10 @@ class FoldersRenderer:
             line = f"{prefix}{branch}{icon}{node.name}{count_info}{status_info}{markdown_info}"
             lines.append(line)
             
-            # Hijos (solo carpetas)
-            folders = [child for child in children if child.is_folder()]
+            # Hijos (solo carpetas); el prefijo de los hijos se concatena una vez
             folders.sort(key=lambda x: x.name.lower())
+            child_prefix = prefix + extend
+            last_index = len(folders) - 1
             
             for i, child in enumerate(folders):
-                is_last_child = (i == len(folders) - 1)
-                self._render_folder_node(child, lines, prefix + extend, is_last_child, config)
\ No newline at end of file
+                self._render_folder_node(child, lines, child_prefix, i == last_index, config)
\ No newline at end of file
@@ -3,22 +3,36 @@
 Menú contextual avanzado para TreeView con acciones específicas por tipo de nodo.
 """
 import tkinter as tk
+from functools import partial
 from tkinter import messagebox, simpledialog
 from typing import Optional, Callable
 from domain.node.node_entity import Node, NodeType, NodeStatus
 from application.commands.node.create_node_command import CreateNodeCommand
-from application.commands.command_bus import get_command_bus
+from application.commands.command_bus import command_bus
 
 
 class TreeContextMenu:
     """Menú contextual para TreeView con acciones avanzadas."""
     
+    # Entradas fijas de submenús: (etiqueta, argumento del comando)
+    _TYPED_FILE_ITEMS = (
+        ("🐍 Archivo Python", '.py'),
+        ("📝 Archivo Markdown", '.md'),
+        ("⚙️ Archivo JSON", '.json'),
+    )
+    _STATUS_ITEMS = (
+        ("✅ Completado", NodeStatus.COMPLETED),
+        ("⬜ En Progreso", NodeStatus.IN_PROGRESS),
+        ("❌ Pendiente", NodeStatus.PENDING),
+        ("🔘 Sin Estado", NodeStatus.NONE),
+    )
+    
     def __init__(self, tree_widget, node_repository, tree_view_instance=None, refresh_callback: Optional[Callable] = None):
         self.tree = tree_widget
         self.node_repository = node_repository
         self.tree_view = tree_view_instance  # Referencia al objeto TreeView
         self.refresh_callback = refresh_callback
-        self.command_bus = get_command_bus()
+        self.command_bus = command_bus
         self.current_item = None
         self.current_node = None
         
@@ -49,18 +63,9 @@ class TreeContextMenu:
             accelerator="Ctrl+N"
         )
         create_menu.add_separator()
-        create_menu.add_command(
-            label="🐍 Archivo Python",
-            command=lambda: self._create_file_with_extension('.py')
-        )
-        create_menu.add_command(
-            label="📝 Archivo Markdown",
-            command=lambda: self._create_file_with_extension('.md')
-        )
-        create_menu.add_command(
-            label="⚙️ Archivo JSON",
-            command=lambda: self._create_file_with_extension('.json')
-        )
+        add_command = create_menu.add_command
+        for label, extension in self._TYPED_FILE_ITEMS:
+            add_command(label=label, command=partial(self._create_file_with_extension, extension))
         
         self.folder_menu_items = [
             ("➕ Nuevo", create_menu),
@@ -79,22 +84,9 @@ class TreeContextMenu:
         """Crear opciones comunes para todos los nodos."""
         # Menú de estados
         status_menu = tk.Menu(self.context_menu, tearoff=0)
-        status_menu.add_command(
-            label="✅ Completado",
-            command=lambda: self._change_status(NodeStatus.COMPLETED)
-        )
-        status_menu.add_command(
-            label="⬜ En Progreso",
-            command=lambda: self._change_status(NodeStatus.IN_PROGRESS)
-        )
-        status_menu.add_command(
-            label="❌ Pendiente",
-            command=lambda: self._change_status(NodeStatus.PENDING)
-        )
-        status_menu.add_command(
-            label="🔘 Sin Estado",
-            command=lambda: self._change_status(NodeStatus.NONE)
-        )
+        add_command = status_menu.add_command
+        for label, status in self._STATUS_ITEMS:
+            add_command(label=label, command=partial(self._change_status, status))
         
         self.common_menu_items = [
             ("✏️ Renombrar", self._rename_node),
@@ -14,6 +14,9 @@ from tkinter import messagebox, simpledialog
 from datetime import datetime
 from ....styling.constants.modern_colors import ModernColors
 
+# Icono por tipo de nodo para las filas del TreeView
+_TYPE_ICONS = {'folder': "📁", 'file': "📄"}
+
 class NodeOperations:
     """Operaciones CRUD con comunicación global en tiempo real"""
     
@@ -22,6 +25,9 @@ class NodeOperations:
         self.repository = repository
         self.event_bus = event_bus
         self.selection_manager = selection_manager
+        
+        # Último contador usado por (padre, nombre base) en _get_unique_name
+        self._name_counters = {}
     
     def create_folder(self, parent_id=None):
         """Crea nueva carpeta con validación"""
@@ -45,7 +51,7 @@ class NodeOperations:
             initialvalue="Nueva Carpeta"
         )
         
-        if not name or not name.strip():
+        if not name or name.isspace():
             return None
         
         name = name.strip()
@@ -54,14 +60,15 @@ class NodeOperations:
         if self._name_exists(name, parent_id):
             name = self._get_unique_name(name, parent_id)
         
-        # Crear en repositorio
-        folder_id = self.repository.create_node(name, "folder", parent_id)
-        self.repository.update_node(
-            folder_id,
-            status='⬜',
-            markdown=f'# {name}',
-            notes=f'Carpeta creada el {datetime.now().strftime("%Y-%m-%d %H:%M")}'
-        )
+        # Crear en repositorio con todos sus campos: una sola escritura a disco
+        folder_id = self.repository.create_nodes_batch([{
+            'name': name,
+            'type': 'folder',
+            'parent_id': parent_id,
+            'status': '⬜',
+            'markdown': f'# {name}',
+            'notes': f'Carpeta creada el {datetime.now().strftime("%Y-%m-%d %H:%M")}'
+        }])[0]
         
         # ⚡ Actualizar TreeView inmediatamente
         self._insert_node_in_tree(folder_id, parent_id)
@@ -91,7 +98,7 @@ class NodeOperations:
             initialvalue="nuevo_archivo.txt"
         )
         
-        if not name or not name.strip():
+        if not name or name.isspace():
             return None
         
         name = name.strip()
@@ -100,15 +107,16 @@ class NodeOperations:
         if self._name_exists(name, parent_id):
             name = self._get_unique_name(name, parent_id)
         
-        # Crear en repositorio
-        file_id = self.repository.create_node(name, "file", parent_id)
-        self.repository.update_node(
-            file_id,
-            status='⬜',
-            markdown=f'# {name}',
-            notes=f'Archivo creado el {datetime.now().strftime("%Y-%m-%d %H:%M")}',
-            code=f'# Contenido de {name}\n'
-        )
+        # Crear en repositorio con todos sus campos: una sola escritura a disco
+        file_id = self.repository.create_nodes_batch([{
+            'name': name,
+            'type': 'file',
+            'parent_id': parent_id,
+            'status': '⬜',
+            'markdown': f'# {name}',
+            'notes': f'Archivo creado el {datetime.now().strftime("%Y-%m-%d %H:%M")}',
+            'code': f'# Contenido de {name}\n'
+        }])[0]
         
         # ⚡ Actualizar TreeView inmediatamente
         self._insert_node_in_tree(file_id, parent_id)
@@ -252,15 +260,17 @@ class NodeOperations:
         # Generar nombre único
         new_name = self._get_unique_name(f"Copia de {source_node['name']}", parent_id)
         
-        # Crear copia
-        new_id = self.repository.create_node(new_name, source_node['type'], parent_id)
-        self.repository.update_node(
-            new_id,
-            status=source_node.get('status', '⬜'),
-            markdown=source_node.get('markdown', ''),
-            notes=source_node.get('notes', '') + f'\n\nCopiado de {source_node["name"]} el {datetime.now().strftime("%Y-%m-%d %H:%M")}',
-            code=source_node.get('code', '')
-        )
+        # Crear copia: los campos son cadenas, basta con copiarlos uno a uno
+        # (sin deepcopy) y crear el nodo con una sola escritura a disco
+        new_id = self.repository.create_nodes_batch([{
+            'name': new_name,
+            'type': source_node['type'],
+            'parent_id': parent_id,
+            'status': source_node.get('status', '⬜'),
+            'markdown': source_node.get('markdown', ''),
+            'notes': source_node.get('notes', '') + f'\n\nCopiado de {source_node["name"]} el {datetime.now().strftime("%Y-%m-%d %H:%M")}',
+            'code': source_node.get('code', '')
+        }])[0]
         
         # ⚡ Insertar en TreeView
         self._insert_node_in_tree(new_id, parent_id)
@@ -279,8 +289,8 @@ class NodeOperations:
         if not node_data:
             return
         
-        icon = "📁" if node_data['type'] == 'folder' else "📄"
-        display_name = f"{icon} {node_data['name']}"
+        is_folder = node_data['type'] == 'folder'
+        display_name = f"{_TYPE_ICONS.get(node_data['type'], '📄')} {node_data['name']}"
         
         parent_item = parent_id if parent_id else ''
         
@@ -290,44 +300,66 @@ class NodeOperations:
             iid=node_id,
             text=display_name,
             values=(node_data.get('status', '⬜'),),
-            open=True if node_data['type'] == 'folder' else False
+            open=is_folder
         )
     
-    def _name_exists(self, name, parent_id):
-        """Verifica si el nombre ya existe en el directorio padre"""
+    def _sibling_names(self, parent_id):
+        """Nombres (en minúsculas) del directorio padre, recogidos en una pasada"""
         
         if parent_id:
             parent_node = self.repository.get_node(parent_id)
-            if parent_node:
-                for child_id in parent_node.get('children', []):
-                    child_node = self.repository.get_node(child_id)
-                    if child_node and child_node['name'].lower() == name.lower():
-                        return True
-        else:
-            # Verificar en la raíz
-            for node_id, node_data in self.repository.nodes.items():
-                if not node_data.get('parent_id') and node_data['name'].lower() == name.lower():
-                    return True
+            if not parent_node:
+                return set()
+            names = set()
+            for child_id in parent_node.get('children', ()):
+                child_node = self.repository.get_node(child_id)
+                if child_node:
+                    names.add(child_node['name'].lower())
+            return names
+        
+        # Nodos de la raíz
+        return {
+            node_data['name'].lower()
+            for node_data in self.repository.nodes.values()
+            if not node_data.get('parent_id')
+        }
+    
+    def _name_exists(self, name, parent_id):
+        """Verifica si el nombre ya existe en el directorio padre"""
         
-        return False
+        return name.lower() in self._sibling_names(parent_id)
     
     def _get_unique_name(self, base_name, parent_id):
         """Genera nombre único agregando contador"""
         
-        counter = 1
-        name = base_name
-        
-        while self._name_exists(name, parent_id):
-            if '.' in base_name:
-                # Para archivos con extensión
-                name_part, ext = base_name.rsplit('.', 1)
-                name = f"{name_part} ({counter}).{ext}"
-            else:
-                # Para carpetas o archivos sin extensión
-                name = f"{base_name} ({counter})"
+        # Índice de nombres calculado una vez: cada candidato es una consulta O(1)
+        taken = self._sibling_names(parent_id)
+        base_lower = base_name.lower()
+        if base_lower not in taken:
+            return base_name
+        
+        # Continuar desde el último contador usado para esta base: copias
+        # repetidas del mismo nodo no vuelven a probar (1), (2), ...
+        key = (parent_id, base_lower)
+        counter = self._name_counters.get(key, 0) + 1
+        
+        # Candidato = prefijo + contador + sufijo, concatenados (el nombre puede
+        # contener llaves, así que no se usa como plantilla de str.format)
+        if '.' in base_name:
+            # Para archivos con extensión
+            name_part, ext = base_name.rsplit('.', 1)
+            prefix, suffix = f"{name_part} (", f").{ext}"
+        else:
+            # Para carpetas o archivos sin extensión
+            prefix, suffix = f"{base_name} (", ")"
+        
+        # El contador son dígitos: prefijo y sufijo se pasan a minúsculas una vez
+        prefix_lower, suffix_lower = prefix.lower(), suffix.lower()
+        while prefix_lower + str(counter) + suffix_lower in taken:
             counter += 1
         
-        return name
+        self._name_counters[key] = counter
+        return prefix + str(counter) + suffix
     
     def _show_status(self, message):
         """Muestra mensaje en status bar"""
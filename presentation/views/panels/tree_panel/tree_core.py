@@ -131,14 +131,16 @@ class TreeCore:
         if node_id and self.tree.exists(node_id) and new_name:
             # Actualizar display inmediatamente
             current_text = self.tree.item(node_id, 'text')
-            # Mantener icono, cambiar solo nombre
+            # Mantener icono, cambiar solo nombre (partition corta en el primer
+            # espacio sin trocear el resto del nombre)
             if current_text:
-                icon = current_text.split(' ')[0]
+                icon = current_text.partition(' ')[0]
                 self.tree.item(node_id, text=f"{icon} {new_name}")
     
     def _on_node_moved(self, data):
         """Nodo movido - Refrescar estructura"""
-        self.refresh_tree()
+        # El movimiento reinsertó la fila sin sus hijos: reconstruir todo
+        self.refresh_tree(full=True)
     
     def _on_editor_name_changed(self, data):
         """Editor cambió nombre - Actualizar TreeView INMEDIATO"""
@@ -164,11 +166,12 @@ class TreeCore:
             self.tree.selection_set(node_id)
             self.tree.focus(node_id)
     
-    def refresh_tree(self):
-        """Refresca el árbol completo"""
+    def refresh_tree(self, full: bool = False):
+        """Refresca el árbol (incremental salvo full=True)"""
         # Delegado a tree_display.py
         self.event_bus.publish('tree_refresh_requested', {
-            'source': 'tree_core'
+            'source': 'tree_core',
+            'full': full
         })
     
     def clear_selection(self):
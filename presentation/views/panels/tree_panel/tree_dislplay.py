@@ -8,20 +8,38 @@ Renderizado y display COMPLETO del TreeView con estilos globales
 - Focus highlighting (Req. 6) ✅
 - Animaciones expand/collapse ✅
 - Actualización tiempo real ✅
+- Refresco incremental: solo inserta, mueve o reescribe filas que cambian ✅
+- Caché de etiqueta/estado/tags por nodo (_apply_tree_row) ✅
+- Proyectos grandes: carpetas nuevas tras LAZY_THRESHOLD filas se insertan
+  cerradas y sus hijos se cargan al expandirlas ✅
 - 120 líneas - COMPLETO AL 100%
 """
 
 import tkinter as tk
 from tkinter import ttk
-from typing import List, Set
+from typing import Dict, List, Set, Tuple
 from ....styling.constants.modern_colors import ModernColors
+from ....styling.constants.fonts import shared_font
 from ..utils.flat_icons import FlatIcons
 from domain.node.node_entity import Node, NodeStatus
 from domain.events.event_bus import global_event_bus
 
+# Tag de estilo por estado (NONE no lleva tag)
+_STATUS_TAGS = {
+    NodeStatus.COMPLETED: 'completed',
+    NodeStatus.IN_PROGRESS: 'in_progress',
+    NodeStatus.PENDING: 'pending',
+}
+
+# Sufijo del iid de la fila marcadora de una carpeta aún no cargada
+_LAZY_SUFFIX = '::lazy'
+
 class TreeDisplay:
     """Maneja renderizado visual COMPLETO y estilos globales del TreeView"""
     
+    # Filas insertadas por refresco antes de diferir los hijos de carpetas nuevas
+    LAZY_THRESHOLD = 1000
+    
     def __init__(self, tree_core, node_repository):
         self.tree_core = tree_core
         self.tree = tree_core.get_tree_widget()
@@ -33,6 +51,28 @@ class TreeDisplay:
         self.focused_item = None
         self.root_items = set()  # Items root (sin hover - Req. 3)
         
+        # Filas de nodos ya insertadas en el TreeView y lo último escrito en cada una
+        self._inserted_ids: Set[str] = set()
+        self._row_position: Dict[str, Tuple[str, int]] = {}  # node_id -> (padre, índice)
+        self._label_cache: Dict[str, Tuple] = {}  # node_id -> (texto, estado, tags)
+        self._placeholder_items: List[str] = []  # Estados vacío/error
+        self._deferred_folders: Set[str] = set()  # Carpetas con hijos sin insertar
+        self._inserted_this_pass = 0  # Filas nuevas del refresco en curso (umbral lazy)
+        self._open_before_rebuild: Dict[str, bool] = {}  # Expansión previa a un full
+        
+        # Iconos y combinaciones de tags precalculados: el refresco no los
+        # recalcula por fila
+        self._folder_icon = FlatIcons.get_folder_icon(is_open=True)
+        self._file_icon = FlatIcons.get_file_icon()
+        self._tag_sets = {
+            (is_folder, status): (
+                ('folder' if is_folder else 'file',)
+                + ((_STATUS_TAGS[status],) if status in _STATUS_TAGS else ())
+            )
+            for is_folder in (True, False)
+            for status in NodeStatus
+        }
+        
         self._setup_modern_styles()
         self._setup_hover_effects()
         self._setup_focus_highlighting()
@@ -45,11 +85,11 @@ class TreeDisplay:
         # Estilos por tipo de nodo
         self.tree.tag_configure('folder', 
                                foreground=ModernColors.DARK_TEXT_PRIMARY,
-                               font=('Segoe UI', 10, 'bold'))
+                               font=shared_font(('Segoe UI', 10, 'bold')))
         
         self.tree.tag_configure('file', 
                                foreground=ModernColors.DARK_TEXT_SECONDARY,
-                               font=('Segoe UI', 10))
+                               font=shared_font(('Segoe UI', 10)))
         
         # Estilos por estado con colores globales
         self.tree.tag_configure('completed', 
@@ -104,7 +144,7 @@ class TreeDisplay:
     
     def _clear_hover(self):
         """Limpia efectos hover"""
-        if self.hovered_item:
+        if self.hovered_item and self.tree.exists(self.hovered_item):
             current_tags = list(self.tree.item(self.hovered_item, "tags"))
             if "hover" in current_tags:
                 current_tags.remove("hover")
@@ -125,6 +165,7 @@ class TreeDisplay:
         
         self.tree.bind("<FocusIn>", on_focus_in)
         self.tree.bind("<FocusOut>", on_focus_out)
+        self.tree.bind("<<TreeviewOpen>>", self._on_tree_open, add='+')
     
     def _set_focus(self, item):
         """Aplica focus highlighting (Req. 6)"""
@@ -137,7 +178,7 @@ class TreeDisplay:
     
     def _clear_focus(self):
         """Limpia focus highlighting"""
-        if self.focused_item:
+        if self.focused_item and self.tree.exists(self.focused_item):
             current_tags = list(self.tree.item(self.focused_item, "tags"))
             if "focus" in current_tags:
                 current_tags.remove("focus")
@@ -159,98 +200,194 @@ class TreeDisplay:
         self.refresh_display()
     
     def refresh_display(self, data=None):
-        """Refresca todo el display del árbol"""
-        
-        # Limpiar árbol actual
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
-        # Reset state
+        """Refresca el display del árbol tocando solo las filas que cambiaron"""
+        
+        # Reconstrucción completa pedida (p. ej. tras mover nodos fuera de aquí)
+        if data and data.get('full'):
+            # La expansión elegida por el usuario sobrevive a la reconstrucción
+            self._open_before_rebuild = {
+                node_id: bool(self.tree.item(node_id, 'open'))
+                for node_id in self._inserted_ids if self.tree.exists(node_id)
+            }
+            self._forget_rows()
+        
+        # Quitar estados vacío/error de un refresco anterior
+        for item in self._placeholder_items:
+            if self.tree.exists(item):
+                self.tree.delete(item)
+        self._placeholder_items.clear()
+        
+        # Reset state (los tags hover/focus se retiran de filas que se conservan)
+        self._clear_hover()
+        self._clear_focus()
         self.root_items.clear()
-        self.hovered_item = None
-        self.focused_item = None
+        
+        seen: Set[str] = set()
+        self._inserted_this_pass = 0
         
         # Cargar nodos raíz
         try:
             root_nodes = self.node_repository.find_roots()
             
-            if not root_nodes:
-                self._create_empty_state()
-            else:
-                for node in root_nodes:
-                    item_id = self._render_node_recursive(node, '')
+            if root_nodes:
+                for index, node in enumerate(root_nodes):
+                    item_id = self._render_node_recursive(node, '', index, seen)
                     # Marcar como root (sin hover - Req. 3)
                     if item_id:
                         self.root_items.add(item_id)
             
+            self._remove_stale_rows(seen)
+            if not root_nodes:
+                self._create_empty_state()
+            
         except Exception as e:
             print(f"❌ Error refrescando display: {e}")
             self._create_error_state(str(e))
+        finally:
+            self._open_before_rebuild = {}
     
-    def _render_node_recursive(self, node: Node, parent_id: str) -> str:
-        """Renderiza un nodo y sus hijos recursivamente"""
+    def _render_node_recursive(self, node: Node, parent_id: str, index: int, seen: Set[str],
+                               append: bool = False) -> str:
+        """Inserta o actualiza un nodo y sus hijos recursivamente (padre antes que hijos)"""
         
         try:
-            # Icono Material Design simple
-            icon = self._get_node_icon(node)
-            
-            # Texto de display
-            display_name = f"{icon} {node.name}"
+            node_id = node.node_id
+            is_folder = node.is_folder()
+            defer = False
+            fresh = False
             
-            # Tags de estilo
-            tags = self._get_node_tags(node)
+            if node_id not in self._inserted_ids and not self.tree.exists(node_id):
+                # Pasado el umbral de filas insertadas en este refresco, las
+                # carpetas nuevas quedan cerradas y sin hijos; una carpeta que
+                # estaba abierta antes de reconstruir se vuelve a abrir entera
+                was_open = self._open_before_rebuild.get(node_id)
+                defer = (is_folder and not was_open
+                         and self._inserted_this_pass >= self.LAZY_THRESHOLD)
+                is_open = is_folder and not defer if was_open is None else is_folder and was_open
+                fresh = True
+                
+                # Insertar en TreeView; bajo un padre recién creado los hijos llegan
+                # en orden, y 'end' evita que Tk recorra los hermanos buscando el índice
+                display_name, status, tags = self._row_for(node)
+                self.tree.insert(
+                    parent_id,
+                    'end' if append else index,
+                    iid=node_id,
+                    text=display_name,
+                    values=(status,),
+                    open=is_open,  # Carpetas abiertas por defecto
+                    tags=tags
+                )
+                self._label_cache[node_id] = (display_name, status, tags)
+                self._inserted_ids.add(node_id)
+                self._inserted_this_pass += 1
+            else:
+                # Fila ya presente: solo se escribe lo que cambió y la expansión
+                # del usuario se conserva
+                if self._row_position.get(node_id) != (parent_id, index):
+                    self.tree.move(node_id, parent_id, index)
+                self._apply_tree_row(node)
             
-            # Insertar en TreeView
-            item_id = self.tree.insert(
-                parent_id,
-                'end',
-                iid=node.node_id,
-                text=display_name,
-                values=(node.status.value,),
-                open=node.is_folder(),  # Carpetas abiertas por defecto
-                tags=tags
-            )
+            self._row_position[node_id] = (parent_id, index)
+            seen.add(node_id)
             
-            # Renderizar hijos si es carpeta
-            if node.is_folder():
-                children = self.node_repository.find_children(node.node_id)
-                # Ordenar: carpetas primero, luego archivos alfabéticamente
-                children.sort(key=lambda x: (x.is_file(), x.name.lower()))
+            # Renderizar hijos si es carpeta (salvo que se carguen al expandir)
+            if is_folder and node_id not in self._deferred_folders:
+                children = self._sorted_children(node_id)
                 
-                for child in children:
-                    self._render_node_recursive(child, node.node_id)
+                if defer and children:
+                    # Fila marcadora para que la carpeta muestre su flecha
+                    self.tree.insert(node_id, 'end', iid=node_id + _LAZY_SUFFIX, text='…')
+                    self._deferred_folders.add(node_id)
+                else:
+                    for child_index, child in enumerate(children):
+                        self._render_node_recursive(child, node_id, child_index, seen, fresh)
             
-            return item_id
+            return node_id
             
         except Exception as e:
             print(f"❌ Error renderizando nodo {node.name}: {e}")
             return None
     
-    def _get_node_icon(self, node: Node) -> str:
-        """Obtiene icono Material Design simple"""
+    def _sorted_children(self, node_id: str) -> List[Node]:
+        """Hijos del nodo: carpetas primero, luego archivos alfabéticamente"""
         
-        if node.is_folder():
-            return FlatIcons.get_folder_icon(is_open=True)
-        else:
-            return FlatIcons.get_file_icon()
+        children = self.node_repository.find_children(node_id)
+        children.sort(key=lambda x: (x.is_file(), x.name.lower()))
+        return children
     
-    def _get_node_tags(self, node: Node) -> List[str]:
-        """Obtiene tags de estilo para el nodo"""
+    def _on_tree_open(self, event=None):
+        """Carpeta expandida: inserta sus hijos si aún estaban diferidos"""
         
-        tags = []
+        node_id = self.tree.focus()
+        if node_id in self._deferred_folders:
+            self._expand_deferred(node_id)
+    
+    def _expand_deferred(self, node_id: str):
+        """Sustituye la fila marcadora por los hijos reales de la carpeta"""
+        
+        self._deferred_folders.discard(node_id)
+        placeholder = node_id + _LAZY_SUFFIX
+        if self.tree.exists(placeholder):
+            self.tree.delete(placeholder)
+        
+        seen: Set[str] = set()
+        self._inserted_this_pass = 0
+        for child_index, child in enumerate(self._sorted_children(node_id)):
+            self._render_node_recursive(child, node_id, child_index, seen, append=True)
+    
+    def _row_for(self, node: Node, name: str = None, icon: str = None) -> Tuple[str, str, Tuple[str, ...]]:
+        """Calcula (texto, estado, tags) de la fila de un nodo"""
         
-        # Tag por tipo
-        tags.append('folder' if node.is_folder() else 'file')
+        display_name = f"{icon or self._get_node_icon(node)} {name or node.name}"
+        return display_name, node.status.value, self._get_node_tags(node)
+    
+    def _apply_tree_row(self, node: Node, name: str = None, icon: str = None) -> bool:
+        """Escribe la fila del nodo solo si difiere de lo último escrito"""
         
-        # Tag por estado
-        if node.status == NodeStatus.COMPLETED:
-            tags.append('completed')
-        elif node.status == NodeStatus.IN_PROGRESS:
-            tags.append('in_progress')
-        elif node.status == NodeStatus.PENDING:
-            tags.append('pending')
+        row = self._row_for(node, name, icon)
+        if self._label_cache.get(node.node_id) == row:
+            return False
         
-        return tags
+        display_name, status, tags = row
+        self.tree.item(node.node_id, text=display_name, values=(status,), tags=tags)
+        self._label_cache[node.node_id] = row
+        self._inserted_ids.add(node.node_id)
+        return True
+    
+    def _forget_rows(self):
+        """Vacía el árbol y el registro de filas para una reconstrucción completa"""
+        
+        self.tree.delete(*self.tree.get_children())
+        self._inserted_ids.clear()
+        self._deferred_folders.clear()
+        self._row_position.clear()
+        self._label_cache.clear()
+        self.hovered_item = None
+        self.focused_item = None
+    
+    def _remove_stale_rows(self, seen: Set[str]):
+        """Elimina las filas de nodos que ya no existen en el repositorio"""
+        
+        stale = self._inserted_ids - seen
+        for node_id in stale:
+            # Un ancestro eliminado antes ya se llevó a sus descendientes
+            if self.tree.exists(node_id):
+                self.tree.delete(node_id)
+            self._row_position.pop(node_id, None)
+            self._label_cache.pop(node_id, None)
+        self._inserted_ids = seen
+        self._deferred_folders &= seen
+    
+    def _get_node_icon(self, node: Node) -> str:
+        """Obtiene icono Material Design simple"""
+        
+        return self._folder_icon if node.is_folder() else self._file_icon
+    
+    def _get_node_tags(self, node: Node) -> Tuple[str, ...]:
+        """Obtiene tags de estilo para el nodo (tupla compartida por tipo y estado)"""
+        
+        return self._tag_sets[node.is_folder(), node.status]
     
     def _create_empty_state(self):
         """Crea estado vacío cuando no hay nodos"""
@@ -259,10 +396,11 @@ class TreeDisplay:
                                    text="📁 Sin contenido - Crear nueva carpeta",
                                    values=('⬜',),
                                    tags=('empty_state',))
+        self._placeholder_items.append(empty_id)
         
         self.tree.tag_configure('empty_state',
                                foreground=ModernColors.DARK_TEXT_MUTED,
-                               font=('Segoe UI', 10, 'italic'))
+                               font=shared_font(('Segoe UI', 10, 'italic')))
     
     def _create_error_state(self, error_msg: str):
         """Crea estado de error"""
@@ -271,10 +409,11 @@ class TreeDisplay:
                                    text=f"❌ Error: {error_msg}",
                                    values=('❌',),
                                    tags=('error_state',))
+        self._placeholder_items.append(error_id)
         
         self.tree.tag_configure('error_state',
                                foreground=ModernColors.DARK_ERROR,
-                               font=('Segoe UI', 10))
+                               font=shared_font(('Segoe UI', 10)))
     
     # Event handlers tiempo real
     def _on_status_changed(self, data):
@@ -284,14 +423,12 @@ class TreeDisplay:
         new_status = data.get('new_status')
         
         if node_id and self.tree.exists(node_id):
-            # Actualizar valor en columna
-            self.tree.set(node_id, 'status', new_status)
-            
-            # Actualizar tags de estilo
             node = self.node_repository.find_by_id(node_id)
             if node:
-                new_tags = self._get_node_tags(node)
-                self.tree.item(node_id, tags=new_tags)
+                # Valor de columna y tags de estilo, solo si cambiaron
+                self._apply_tree_row(node)
+            else:
+                self.tree.set(node_id, 'status', new_status)
     
     def _on_theme_changed(self, data):
         """Theme cambió - Reconfigurar estilos"""
@@ -308,14 +445,8 @@ class TreeDisplay:
             # Actualizar icono con animación simple
             node = self.node_repository.find_by_id(node_id)
             if node and node.is_folder():
-                new_icon = FlatIcons.get_folder_icon(is_open=is_open)
-                current_text = self.tree.item(node_id, 'text')
                 # Reemplazar solo el icono
-                if current_text:
-                    parts = current_text.split(' ', 1)
-                    if len(parts) > 1:
-                        new_text = f"{new_icon} {parts[1]}"
-                        self.tree.item(node_id, text=new_text)
+                self._apply_tree_row(node, icon=FlatIcons.get_folder_icon(is_open=is_open))
     
     # Métodos públicos COMPLETOS
     def update_node_display(self, node_id: str, new_name: str):
@@ -328,10 +459,8 @@ class TreeDisplay:
         if not node:
             return False
         
-        # Actualizar display con nuevo nombre
-        icon = self._get_node_icon(node)
-        display_name = f"{icon} {new_name}"
-        self.tree.item(node_id, text=display_name)
+        # Actualizar display con nuevo nombre (sin escribir si no cambió)
+        self._apply_tree_row(node, name=new_name)
         
         return True
     
@@ -2,18 +2,42 @@
 """
 Gestor de configuración centralizado para TreeCreator.
 """
-import json
+import atexit
 import os
+import re
+import threading
 from typing import Dict, Any, Optional
 from pathlib import Path
 
+from shared import json_codec
+
+# Nombres de modo en español -> clave en preview_panel.modes (una sola pasada)
+_MODE_ALIASES = {'ascii_completo': 'ascii_full', 'solo_carpetas': 'folders'}
+_MODE_ALIAS_RE = re.compile('|'.join(_MODE_ALIASES))
+
+
+def _preview_mode_key(mode: str) -> str:
+    """Normalizar el nombre visible de un modo ('ASCII Completo') a su clave."""
+    key = mode.lower().replace(' ', '_')
+    return _MODE_ALIAS_RE.sub(lambda match: _MODE_ALIASES[match.group()], key)
+
 
 class ConfigManager:
     """Gestor centralizado de configuración de la aplicación."""
     
+    # Configuración de usuario ya parseada: (ruta, mtime_ns, tamaño) -> dict
+    _cache: Dict[tuple, Dict[str, Any]] = {}
+    
     def __init__(self, config_file: str = "treeapp_config.json"):
         self.config_file = Path(config_file)
         self.config_data: Dict[str, Any] = {}
+        self._saved_snapshot: Optional[bytes] = None  # Último contenido escrito
+        self.save_delay = 0.5  # s que schedule_save espera antes de escribir
+        self._save_timer: Optional[threading.Timer] = None
+        self._exit_flush_registered = False
+        # El guardado programado corre en el hilo del Timer mientras la UI
+        # sigue llamando a set(): ambos pasan por este lock
+        self._lock = threading.RLock()
         self._load_default_config()
         self._load_user_config()
     
@@ -104,33 +128,52 @@ class ConfigManager:
         """Cargar configuración del usuario desde archivo."""
         if self.config_file.exists():
             try:
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    user_config = json.load(f)
-                    self._merge_config(self.config_data, user_config)
+                # Reutilizar el dict parseado si el archivo no cambió
+                st = os.stat(self.config_file)
+                key = (str(self.config_file), st.st_mtime_ns, st.st_size)
+                user_config = ConfigManager._cache.get(key)
+                if user_config is None:
+                    with open(self.config_file, 'rb') as f:
+                        user_config = json_codec.loads(f.read())
+                    ConfigManager._cache[key] = user_config
+                self._merge_config(self.config_data, user_config)
+                # Lo cargado ya está en disco: guardar sin cambios no reescribe
+                self._saved_snapshot = json_codec.dumps(self.config_data)
                 print(f"✅ Configuración cargada desde {self.config_file}")
             except Exception as e:
                 print(f"❌ Error cargando configuración: {e}")
                 self._create_backup_config()
     
     def _merge_config(self, default: Dict, user: Dict):
-        """Fusionar configuración de usuario con la por defecto."""
+        """Fusionar configuración de usuario con la por defecto (copiando contenedores)."""
         for key, value in user.items():
-            if key in default:
-                if isinstance(default[key], dict) and isinstance(value, dict):
-                    self._merge_config(default[key], value)
-                else:
-                    default[key] = value
+            if isinstance(value, dict):
+                # No compartir dicts con el origen (p. ej. la caché de clase)
+                if not isinstance(default.get(key), dict):
+                    default[key] = {}
+                self._merge_config(default[key], value)
+            elif isinstance(value, list):
+                default[key] = list(value)
             else:
                 default[key] = value
     
     def save_config(self):
-        """Guardar configuración actual a archivo."""
+        """Guardar configuración actual a archivo (omite la escritura si no cambió)."""
         try:
-            # Crear directorio si no existe
-            self.config_file.parent.mkdir(parents=True, exist_ok=True)
-            
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.config_data, f, indent=2, ensure_ascii=False)
+            with self._lock:
+                snapshot = json_codec.dumps(self.config_data)
+                if snapshot == self._saved_snapshot and self.config_file.exists():
+                    return True
+                
+                # Crear directorio si no existe
+                self.config_file.parent.mkdir(parents=True, exist_ok=True)
+                
+                # Escritura atómica: un fallo a mitad no corrompe el archivo
+                tmp_file = self.config_file.with_suffix('.json.tmp')
+                with open(tmp_file, 'wb') as f:
+                    f.write(snapshot)
+                os.replace(tmp_file, self.config_file)
+                self._saved_snapshot = snapshot
             
             print(f"✅ Configuración guardada en {self.config_file}")
             return True
@@ -139,6 +182,30 @@ class ConfigManager:
             print(f"❌ Error guardando configuración: {e}")
             return False
     
+    def schedule_save(self):
+        """Programar un guardado; cambios seguidos (tema, tamaños) se agrupan en uno."""
+        with self._lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+            
+            self._save_timer = threading.Timer(self.save_delay, self.flush)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+            
+            # El Timer es daemon: un guardado aún pendiente al salir se hace aquí
+            if not self._exit_flush_registered:
+                atexit.register(self.flush)
+                self._exit_flush_registered = True
+    
+    def flush(self) -> bool:
+        """Escribir ya el guardado programado, si lo hay (p. ej. al cerrar)."""
+        with self._lock:
+            timer, self._save_timer = self._save_timer, None
+            if timer is None:
+                return True
+            timer.cancel()
+            return self.save_config()
+    
     def _create_backup_config(self):
         """Crear respaldo de configuración corrupta."""
         if self.config_file.exists():
@@ -172,17 +239,18 @@ class ConfigManager:
         Ejemplo: set("preview_panel.modes.classic.indent_spaces", 6)
         """
         keys = key_path.split('.')
-        current = self.config_data
         
         try:
-            # Navegar hasta el penúltimo nivel
-            for key in keys[:-1]:
-                if key not in current:
-                    current[key] = {}
-                current = current[key]
-            
-            # Establecer el valor final
-            current[keys[-1]] = value
+            with self._lock:
+                current = self.config_data
+                # Navegar hasta el penúltimo nivel
+                for key in keys[:-1]:
+                    if key not in current:
+                        current[key] = {}
+                    current = current[key]
+                
+                # Establecer el valor final
+                current[keys[-1]] = value
             return True
             
         except Exception as e:
@@ -191,12 +259,12 @@ class ConfigManager:
     
     def get_preview_config(self, mode: str) -> Dict[str, Any]:
         """Obtener configuración específica para un modo de vista previa."""
-        mode_key = mode.lower().replace(' ', '_').replace('ascii_completo', 'ascii_full').replace('solo_carpetas', 'folders')
+        mode_key = _preview_mode_key(mode)
         return self.get(f"preview_panel.modes.{mode_key}", {})
     
     def set_preview_config(self, mode: str, config: Dict[str, Any]) -> bool:
         """Establecer configuración para un modo de vista previa."""
-        mode_key = mode.lower().replace(' ', '_').replace('ascii_completo', 'ascii_full').replace('solo_carpetas', 'folders')
+        mode_key = _preview_mode_key(mode)
         return self.set(f"preview_panel.modes.{mode_key}", config)
     
     def reset_to_defaults(self):
@@ -207,8 +275,8 @@ class ConfigManager:
     def export_config(self, export_file: str) -> bool:
         """Exportar configuración a archivo específico."""
         try:
-            with open(export_file, 'w', encoding='utf-8') as f:
-                json.dump(self.config_data, f, indent=2, ensure_ascii=False)
+            with open(export_file, 'wb') as f:
+                f.write(json_codec.dumps(self.config_data))
             return True
         except Exception as e:
             print(f"❌ Error exportando configuración: {e}")
@@ -217,8 +285,8 @@ class ConfigManager:
     def import_config(self, import_file: str) -> bool:
         """Importar configuración desde archivo."""
         try:
-            with open(import_file, 'r', encoding='utf-8') as f:
-                imported_config = json.load(f)
+            with open(import_file, 'rb') as f:
+                imported_config = json_codec.loads(f.read())
                 self._merge_config(self.config_data, imported_config)
             return self.save_config()
         except Exception as e:
@@ -243,7 +311,8 @@ class ConfigManager:
         if y is not None:
             self.set('app.window_y', y)
         
-        self.save_config()
+        # Se llama en cada redimensionado: escribir una vez al terminar
+        self.schedule_save()
 
 
 # Instancia global del gestor de configuración
@@ -0,0 +1,71 @@
+"""
+shared/json_codec.py
+====================
+
+Codificación JSON para datos y configuración
+- Usa orjson si está instalado (extensión nativa, emite bytes)
+- Si no, ujson (también en C); en último caso el módulo json estándar
+- dumps produce UTF-8 indentado a 2 espacios (configuración, exportaciones);
+  dumps_compact, UTF-8 sin espacios
+- write_mapping_document escribe un objeto grande por trozos en JSON
+  compacto, una entrada por línea, sin construir un único bytes con todo
+  el documento (es el formato de los datos guardados por el repositorio)
+"""
+
+from typing import Any, BinaryIO, Mapping
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+    try:
+        import ujson as json
+    except ImportError:
+        import json
+
+
+if orjson is not None:
+    def dumps(data: Any) -> bytes:
+        """Serializa a bytes UTF-8 indentados a 2 espacios"""
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+    def loads(raw: bytes) -> Any:
+        """Deserializa desde bytes o str"""
+        return orjson.loads(raw)
+
+    def dumps_compact(data: Any) -> bytes:
+        """Serializa a bytes UTF-8 sin espacios"""
+        return orjson.dumps(data)
+else:
+    def dumps(data: Any) -> bytes:
+        """Serializa a bytes UTF-8 indentados a 2 espacios"""
+        return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+    def loads(raw: bytes) -> Any:
+        """Deserializa desde bytes o str"""
+        return json.loads(raw)
+
+    def dumps_compact(data: Any) -> bytes:
+        """Serializa a bytes UTF-8 sin espacios"""
+        return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def write_mapping_document(f: BinaryIO, fields: Mapping[str, Any], key: str,
+                           mapping: Mapping[str, Any]):
+    """
+    Escribe {**fields, key: mapping} en f como JSON compacto, una entrada de
+    mapping por línea (sin indentación dentro de cada entrada)
+    
+    Cada entrada se serializa por separado, así el tamaño de los bytes en
+    memoria depende del nodo más grande y no del documento entero.
+    """
+    f.write(b'{')
+    for name, value in fields.items():
+        f.write(dumps_compact(name) + b':' + dumps_compact(value) + b',')
+    f.write(dumps_compact(key) + b':{')
+    
+    separator = b'\n'
+    for item_key, item_value in mapping.items():
+        f.write(separator + dumps_compact(item_key) + b':' + dumps_compact(item_value))
+        separator = b',\n'
+    f.write(b'\n}}\n')
@@ -0,0 +1,96 @@
+# tests/test_command_bus.py
+"""
+Tests unitarios para CommandBus - registro y despacho de comandos.
+"""
+import unittest
+from dataclasses import dataclass
+from application.commands.command_bus import CommandBus, CommandResult
+from application.commands.node.create_node_command import CreateNodeCommand, CreateNodeCommandHandler
+from domain.node.node_entity import NodeType
+
+
+@dataclass(slots=True)
+class EchoCommand:
+    """Comando de prueba que devuelve su payload."""
+    payload: str = ""
+
+    def execute(self) -> CommandResult:
+        return CommandResult(success=False, error="Use CommandBus.execute() instead")
+
+
+class EchoCommandHandler:
+    """Manejador de prueba para EchoCommand."""
+    __slots__ = ()
+
+    def handle(self, command: EchoCommand) -> CommandResult:
+        return CommandResult(success=True, data=command.payload)
+
+
+class TestCommandBus(unittest.TestCase):
+    """Tests para el despacho de comandos."""
+
+    def test_dispatch_to_registered_handler(self):
+        """El comando llega a su manejador registrado."""
+        bus = CommandBus()
+        bus.register_handler(EchoCommand, EchoCommandHandler())
+
+        result = bus.execute(EchoCommand(payload="hola"))
+        self.assertTrue(result.success)
+        self.assertEqual(result.data, "hola")
+
+    def test_missing_handler(self):
+        """Sin manejador se devuelve un resultado de error."""
+
+        @dataclass
+        class OrphanCommand:
+            def execute(self) -> CommandResult:
+                return CommandResult(success=False)
+
+        result = CommandBus().execute(OrphanCommand())
+        self.assertFalse(result.success)
+        self.assertIn("OrphanCommand", result.error)
+
+    def test_handlers_are_per_bus(self):
+        """Un bus nuevo no despacha a manejadores registrados en otro bus."""
+        CommandBus().register_handler(EchoCommand, EchoCommandHandler())
+
+        result = CommandBus().execute(EchoCommand(payload="hola"))
+        self.assertFalse(result.success)
+        self.assertFalse(hasattr(EchoCommand, '_handler'))
+
+
+class InMemoryNodeRepository:
+    """Repositorio mínimo que guarda los nodos en una lista."""
+
+    def __init__(self):
+        self.saved = []
+
+    def save(self, node):
+        self.saved.append(node)
+        return node
+
+
+class TestCreateNodeCommand(unittest.TestCase):
+    """Tests para el manejador de creación de nodos."""
+
+    def setUp(self):
+        self.repository = InMemoryNodeRepository()
+        self.bus = CommandBus()
+        self.bus.register_handler(CreateNodeCommand, CreateNodeCommandHandler(self.repository))
+
+    def test_valid_node_is_saved(self):
+        """Un nodo válido se construye y se guarda."""
+        result = self.bus.execute(CreateNodeCommand(name="main.py", node_type=NodeType.FILE))
+        self.assertTrue(result.success)
+        self.assertEqual(self.repository.saved[0].name, "main.py")
+
+    def test_invalid_name_is_rejected(self):
+        """Un nombre inválido no llega al repositorio."""
+        result = self.bus.execute(CreateNodeCommand(name="a:b", node_type=NodeType.FILE))
+        self.assertFalse(result.success)
+        self.assertIn("prohibidos", result.error)
+        self.assertEqual(self.repository.saved, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+# tests/test_config_manager.py
+"""
+Tests unitarios para ConfigManager - lectura y guardado de configuración.
+"""
+import os
+import tempfile
+import unittest
+from unittest import mock
+from shared import json_codec
+from shared.config.config_manager import ConfigManager
+
+
+class TestConfigManagerSave(unittest.TestCase):
+    """Tests para el guardado de configuración."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.config_file = os.path.join(self.tmp_dir.name, "config.json")
+        self.config = ConfigManager(self.config_file)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_roundtrip(self):
+        """Los valores guardados se recuperan al recargar."""
+        self.config.set('app.window_width', 1600)
+        self.assertTrue(self.config.save_config())
+
+        reloaded = ConfigManager(self.config_file)
+        self.assertEqual(reloaded.get('app.window_width'), 1600)
+
+    def test_unchanged_config_is_not_rewritten(self):
+        """Un segundo guardado sin cambios no toca el archivo."""
+        self.config.save_config()
+        os.utime(self.config_file, (0, 0))
+
+        self.config.save_config()
+        self.assertEqual(os.path.getmtime(self.config_file), 0)
+
+        self.config.set('app.window_height', 900)
+        self.config.save_config()
+        self.assertNotEqual(os.path.getmtime(self.config_file), 0)
+        self.assertFalse(os.path.exists(self.config_file + '.tmp'))
+
+    def test_save_after_load_does_not_write(self):
+        """Guardar justo después de cargar, sin cambios, no toca el archivo."""
+        self.config.set('app.window_width', 1600)
+        self.config.save_config()
+        os.utime(self.config_file, (0, 0))
+
+        reloaded = ConfigManager(self.config_file)
+        self.assertTrue(reloaded.save_config())
+        self.assertEqual(os.path.getmtime(self.config_file), 0)
+
+    def test_reload_reuses_parsed_file(self):
+        """Una segunda instancia sobre el mismo archivo no vuelve a parsearlo."""
+        self.config.set('validation.reserved_names', ['CON'])
+        self.config.save_config()
+        ConfigManager(self.config_file)
+
+        with mock.patch.object(json_codec, 'loads', side_effect=AssertionError):
+            first = ConfigManager(self.config_file)
+            second = ConfigManager(self.config_file)
+
+        first.get('validation.reserved_names').append('PRN')
+        first.set('preview_panel.modes.classic.indent_spaces', 8)
+        self.assertEqual(second.get('validation.reserved_names'), ['CON'])
+        self.assertEqual(second.get('preview_panel.modes.classic.indent_spaces'), 4)
+
+    def test_scheduled_saves_are_coalesced(self):
+        """Varios schedule_save seguidos producen una sola escritura al hacer flush."""
+        self.config.save_delay = 60  # El temporizador no interviene en el test
+        with mock.patch.object(self.config, 'save_config', wraps=self.config.save_config) as save:
+            self.config.save_window_state(1000, 700)
+            self.config.save_window_state(1100, 750)
+            self.assertEqual(save.call_count, 0)
+
+            self.config.flush()
+            self.config.flush()
+            self.assertEqual(save.call_count, 1)
+
+        reloaded = ConfigManager(self.config_file)
+        self.assertEqual(reloaded.get('app.window_width'), 1100)
+
+    def test_pending_save_is_flushed_at_exit(self):
+        """El guardado programado queda registrado para escribirse al salir."""
+        self.config.save_delay = 60
+        with mock.patch('atexit.register') as register:
+            self.config.save_window_state(1200, 800)
+            self.config.save_window_state(1300, 850)
+        register.assert_called_once_with(self.config.flush)
+
+        register.call_args.args[0]()
+        reloaded = ConfigManager(self.config_file)
+        self.assertEqual(reloaded.get('app.window_width'), 1300)
+
+    def test_preview_mode_names_are_normalized(self):
+        """Los nombres visibles de modo se traducen a su clave de configuración."""
+        self.assertEqual(self.config.get_preview_config('ASCII Completo'),
+                         self.config.get('preview_panel.modes.ascii_full'))
+        self.config.set_preview_config('ASCII Solo Carpetas', {'show_icons': False})
+        self.assertEqual(self.config.get('preview_panel.modes.ascii_folders'), {'show_icons': False})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+# tests/test_event_bus.py
+"""
+Tests unitarios para EventBus - suscripción, publicación e historial.
+"""
+import unittest
+from domain.events.event_bus import EventBus
+
+
+class TestEventBus(unittest.TestCase):
+    """Tests para la publicación de eventos."""
+
+    def setUp(self):
+        self.bus = EventBus()
+
+    def test_publish_in_subscription_order(self):
+        """Los suscriptores se notifican en orden de suscripción."""
+        calls = []
+        self.bus.subscribe('tree_updated', lambda data: calls.append(('a', data)))
+        self.bus.subscribe('tree_updated', lambda data: calls.append(('b', data)))
+
+        self.bus.publish('tree_updated', 1)
+        self.assertEqual(calls, [('a', 1), ('b', 1)])
+
+    def test_unsubscribe_during_publish(self):
+        """Desuscribirse dentro de un callback no salta al siguiente suscriptor."""
+        calls = []
+
+        def once(data):
+            calls.append('once')
+            self.bus.unsubscribe('tick', once)
+
+        self.bus.subscribe('tick', once)
+        self.bus.subscribe('tick', lambda data: calls.append('always'))
+
+        self.bus.publish('tick')
+        self.bus.publish('tick')
+        self.assertEqual(calls, ['once', 'always', 'always'])
+        self.assertEqual(self.bus.get_subscribers_count('tick'), 1)
+
+    def test_history_keeps_last_100(self):
+        """El historial conserva solo los últimos 100 eventos."""
+        for i in range(150):
+            self.bus.publish('event', i)
+
+        history = self.bus.get_event_history(limit=200)
+        self.assertEqual(len(history), 100)
+        self.assertEqual(history[0]['data'], 50)
+        self.assertEqual(self.bus.get_event_history(limit=1)[0]['data'], 149)
+
+
+if __name__ == '__main__':
+    unittest.main()
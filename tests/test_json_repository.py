@@ -0,0 +1,267 @@
+# tests/test_json_repository.py
+"""
+Tests unitarios para JsonRepository - persistencia y estadísticas.
+"""
+import json
+import os
+import tempfile
+import time
+import unittest
+from unittest import mock
+from infrastructure.persistence.json_repository import JsonRepository
+from infrastructure.persistence.node_table import STATUS_COMPLETED_EMOJI
+from application.services.workspace_manager import WorkspaceManager
+
+
+class RepositoryTestCase(unittest.TestCase):
+    """Base: directorio temporal con un repositorio en data.json."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.file_path = os.path.join(self.tmp_dir.name, "data.json")
+        self.repo = self.make_repo()
+
+    def make_repo(self, file_name="data.json", **kwargs):
+        """Abrir un repositorio sobre un archivo del directorio temporal."""
+        repo = JsonRepository(os.path.join(self.tmp_dir.name, file_name), **kwargs)
+        self.addCleanup(repo.close)  # Antes de borrar el directorio (LIFO)
+        return repo
+
+    def count_saves(self, repo):
+        """Registrar cada save_data del repositorio; devuelve la lista de llamadas."""
+        saves = []
+        original_save = repo.save_data
+
+        def counting_save():
+            saves.append(1)
+            original_save()
+
+        repo.save_data = counting_save
+        return saves
+
+
+class TestJsonRepositoryStats(RepositoryTestCase):
+    """Tests para estadísticas del repositorio."""
+
+    def test_stats_follow_mutations(self):
+        """Las estadísticas reflejan creación, actualización y borrado."""
+        root_id = self.repo.create_node("Root", "folder")
+        file_id = self.repo.create_node("main.py", "file", root_id)
+        other_id = self.repo.create_node("README.md", "file", root_id)
+        self.repo.update_node(file_id, status='✅')
+        self.repo.update_node(other_id, status='❌')
+
+        stats = self.repo.get_stats()
+        self.assertEqual(stats['total_nodes'], 3)
+        self.assertEqual(stats['folders'], 1)
+        self.assertEqual(stats['files'], 2)
+        self.assertEqual(stats['completed'], 1)
+        self.assertEqual(stats['pending'], 1)
+        self.assertEqual(stats['blocked'], 1)
+
+        self.repo.delete_node(file_id)
+        stats = self.repo.get_stats()
+        self.assertEqual(stats['total_nodes'], 2)
+        self.assertEqual(stats['files'], 1)
+        self.assertEqual(stats['completed'], 0)
+
+    def test_delete_removes_whole_branch(self):
+        """Borrar una carpeta elimina su rama completa con una sola escritura."""
+        root_id = self.repo.create_node("Root", "folder")
+        src_id = self.repo.create_node("src", "folder", root_id)
+        pkg_id = self.repo.create_node("pkg", "folder", src_id)
+        self.repo.create_node("main.py", "file", pkg_id)
+        self.repo.create_node("README.md", "file", root_id)
+
+        saves = self.count_saves(self.repo)
+        self.assertTrue(self.repo.delete_node(src_id))
+
+        self.assertEqual(len(saves), 1)
+        self.assertEqual(self.repo.get_node_count(), 2)
+        self.assertNotIn(src_id, self.repo.get_children(root_id))
+        self.assertEqual(self.repo.get_stats()['folders'], 1)
+
+    def test_stats_after_reload(self):
+        """Las estadísticas se reconstruyen al cargar desde disco."""
+        root_id = self.repo.create_node("Root", "folder")
+        file_id = self.repo.create_node("main.py", "file", root_id)
+        self.repo.update_node(file_id, status='✅')
+        self.repo.flush()
+
+        reloaded = self.make_repo()
+        self.assertEqual(reloaded.get_stats(), self.repo.get_stats())
+
+    def test_status_is_interned(self):
+        """Los estados guardados comparten el objeto internado, también tras recargar."""
+        root_id = self.repo.create_node("Root", "folder")
+        self.repo.update_node(root_id, status=''.join(['✅']))
+        self.assertIs(self.repo.get_node(root_id)['status'], STATUS_COMPLETED_EMOJI)
+        self.repo.flush()
+
+        reloaded = self.make_repo()
+        self.assertIs(reloaded.get_node(root_id)['status'], STATUS_COMPLETED_EMOJI)
+
+    def test_saved_file_is_plain_json(self):
+        """El guardado por trozos produce un documento JSON válido."""
+        root_id = self.repo.create_node("Root", "folder")
+        for index in range(50):
+            self.repo.create_node(f"ñ_{index}.py", "file", root_id)
+
+        with open(self.file_path, encoding='utf-8') as f:
+            data = json.load(f)
+        self.assertEqual(data['root_id'], root_id)
+        self.assertEqual(len(data['nodes']), 51)
+        self.assertEqual(data['nodes'][root_id]['children'], self.repo.get_children(root_id))
+
+    def test_compressed_roundtrip(self):
+        """Una ruta .gz se guarda comprimida y se recarga de forma transparente."""
+        repo = self.make_repo("data.json.gz")
+        root_id = repo.create_node("Root", "folder")
+        repo.create_node("main.py", "file", root_id)
+
+        with open(repo.file_path, 'rb') as f:
+            self.assertEqual(f.read(2), b'\x1f\x8b')
+
+        plain = self.make_repo("data.json.gz", compress=False)
+        self.assertEqual(plain.get_stats(), repo.get_stats())
+
+
+class TestJsonRepositoryDeferredSave(RepositoryTestCase):
+    """Tests para la escritura diferida de update_node."""
+
+    def setUp(self):
+        super().setUp()
+        self.repo.flush_delay = 60  # El hilo de fondo no interviene en el test
+
+    def test_update_is_written_on_flush(self):
+        """update_node no escribe de inmediato; flush() persiste el cambio."""
+        root_id = self.repo.create_node("Root", "folder")
+        self.repo.update_node(root_id, markdown="# Nuevo")
+        self.assertEqual(self.make_repo().get_node(root_id)['markdown'], '')
+
+        self.repo.flush()
+        self.assertEqual(self.make_repo().get_node(root_id)['markdown'], '# Nuevo')
+
+    def test_background_thread_flushes(self):
+        """El hilo de fondo persiste los cambios tras el retardo."""
+        self.repo.flush_delay = 0.01
+        root_id = self.repo.create_node("Root", "folder")
+        self.repo.update_node(root_id, status='✅')
+
+        for _ in range(200):
+            time.sleep(0.01)
+            with self.repo._lock:
+                if not self.repo._dirty.is_set():
+                    break
+        self.assertEqual(self.make_repo().get_node(root_id)['status'], '✅')
+
+    def test_close_flushes_and_stops_thread(self):
+        """close() persiste lo pendiente y termina el hilo de fondo."""
+        root_id = self.repo.create_node("Root", "folder")
+        self.repo.update_node(root_id, notes="pendiente")
+
+        self.repo.close()
+        self.assertFalse(self.repo._flush_thread.is_alive())
+        self.assertEqual(self.make_repo().get_node(root_id)['notes'], 'pendiente')
+
+    def test_close_without_changes_does_not_write(self):
+        """close() sin cambios pendientes no reescribe el archivo."""
+        self.repo.create_node("Root", "folder")
+        saves = self.count_saves(self.repo)
+
+        self.repo.close()
+        self.repo.close()
+        self.assertEqual(saves, [])
+        self.assertFalse(self.repo._flush_thread.is_alive())
+
+    def test_close_is_registered_at_exit(self):
+        """Una salida sin pasar por la ventana (Ctrl+C, excepción) también guarda."""
+        with mock.patch('atexit.register') as register:
+            repo = self.make_repo("other.json")
+        register.assert_called_once_with(repo.close)
+
+        root_id = repo.create_node("Root", "folder")
+        repo.update_node(root_id, notes='al salir')
+        register.call_args.args[0]()
+        self.assertEqual(self.make_repo("other.json").get_node(root_id)['notes'], 'al salir')
+
+
+class TestJsonRepositoryBatch(RepositoryTestCase):
+    """Tests para escrituras agrupadas."""
+
+    def setUp(self):
+        super().setUp()
+        self.saves = self.count_saves(self.repo)
+
+    def test_batch_writes_once(self):
+        """Las mutaciones dentro de batch() se guardan una sola vez al salir."""
+        with self.repo.batch():
+            root_id = self.repo.create_node("Root", "folder")
+            self.repo.create_node("main.py", "file", root_id)
+            self.repo.update_node(root_id, status='✅')
+            self.assertEqual(len(self.saves), 0)
+        self.assertEqual(len(self.saves), 1)
+
+    def test_create_nodes_batch(self):
+        """create_nodes_batch crea nodos en orden y persiste una vez."""
+        root_id = self.repo.create_node("Root", "folder")
+        self.saves.clear()
+        ids = self.repo.create_nodes_batch([
+            {'name': 'src', 'type': 'folder', 'parent_id': root_id},
+            {'name': 'README.md', 'type': 'file', 'parent_id': root_id, 'status': '✅'},
+        ])
+        self.assertEqual(len(self.saves), 1)
+        self.assertEqual(self.repo.get_children(root_id), ids)
+        self.assertEqual(self.repo.get_node(ids[1])['status'], '✅')
+
+        reloaded = self.make_repo()
+        self.assertEqual(reloaded.get_node_count(), 3)
+
+    def test_batch_ids_are_unique_hex(self):
+        """Los IDs de un lote son distintos y conservan el formato hex de uuid4."""
+        ids = self.repo.create_nodes_batch([{'name': f'n{i}', 'type': 'file'} for i in range(100)])
+        self.assertEqual(len(set(ids)), 100)
+        for node_id in ids:
+            self.assertEqual(len(node_id), 32)
+            int(node_id, 16)
+
+
+class TestWorkspacePreviewCache(RepositoryTestCase):
+    """Tests para el cache de datos de vista previa."""
+
+    def setUp(self):
+        super().setUp()
+        self.manager = WorkspaceManager(self.repo)
+
+    def test_preview_cached_until_root_changes(self):
+        """El cache se reutiliza y se invalida al actualizar el root."""
+        self.manager.initialize_workspace_if_needed()
+        first = self.manager.get_initial_preview_data()
+        self.assertIs(self.manager.get_initial_preview_data(), first)
+
+        self.repo.update_node(self.repo.root_id, status='✅')
+        updated = self.manager.get_initial_preview_data()
+        self.assertIsNot(updated, first)
+        self.assertEqual(updated['status'], '✅')
+
+    def test_preview_follows_root_children(self):
+        """Crear o borrar hijos del root invalida el cache de vista previa."""
+        self.manager.initialize_workspace_if_needed()
+        root_id = self.repo.root_id
+        self.assertEqual(self.manager.get_initial_preview_data()['children'], ())
+
+        child_id = self.repo.create_node("main.py", "file", root_id)
+        preview = self.manager.get_initial_preview_data()
+        self.assertEqual(list(preview['children']), list(self.repo.get_children(root_id)))
+
+        batch_ids = self.repo.create_nodes_batch([{'name': 'src', 'type': 'folder', 'parent_id': root_id}])
+        self.assertEqual(preview['children'], (child_id,))  # El dict anterior no cambia
+        self.assertEqual(self.manager.get_initial_preview_data()['children'], (child_id, *batch_ids))
+
+        self.repo.delete_node(child_id)
+        self.assertEqual(self.manager.get_initial_preview_data()['children'], tuple(batch_ids))
+
+
+if __name__ == '__main__':
+    unittest.main()
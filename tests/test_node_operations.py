@@ -0,0 +1,47 @@
+# tests/test_node_operations.py
+"""
+Tests unitarios para NodeOperations - generación de nombres únicos.
+"""
+import unittest
+from presentation.views.panels.tree_panel.operations.node_operations import NodeOperations
+
+
+class FakeRepository:
+    """Repositorio mínimo: solo nodos en la raíz."""
+
+    def __init__(self, *names):
+        self.nodes = {}
+        for name in names:
+            self.add(name)
+
+    def add(self, name):
+        self.nodes[str(len(self.nodes))] = {'name': name, 'parent_id': None}
+
+
+class TestUniqueName(unittest.TestCase):
+    """Tests para _get_unique_name."""
+
+    def make_operations(self, *names):
+        self.repository = FakeRepository(*names)
+        return NodeOperations(None, self.repository, None, None)
+
+    def test_free_name_is_kept(self):
+        """Un nombre libre se devuelve tal cual."""
+        operations = self.make_operations('a.txt')
+        self.assertEqual(operations._get_unique_name('b.txt', None), 'b.txt')
+
+    def test_counter_skips_taken_names(self):
+        """El contador salta los nombres ocupados, sin distinguir mayúsculas."""
+        operations = self.make_operations('Notas.txt', 'notas (1).TXT', 'Docs')
+        self.assertEqual(operations._get_unique_name('Notas.txt', None), 'Notas (2).txt')
+        self.assertEqual(operations._get_unique_name('Docs', None), 'Docs (1)')
+
+    def test_names_with_braces(self):
+        """Las llaves del nombre se conservan literalmente."""
+        operations = self.make_operations('a{b}.txt', 'x{}', 'a{b} (1).txt')
+        self.assertEqual(operations._get_unique_name('a{b}.txt', None), 'a{b} (2).txt')
+        self.assertEqual(operations._get_unique_name('x{}', None), 'x{} (1)')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,41 @@
+# tests/test_txt_exporter.py
+"""
+Tests unitarios para TXTExporter - vista previa de la exportación.
+"""
+import importlib.util
+import os
+import unittest
+from unittest import mock
+
+# El paquete se llama exporter.py/, así que el módulo se carga por ruta
+_PATH = os.path.join(os.path.dirname(__file__), '..', 'presentation', 'views', 'panels',
+                     'preview_panel', 'exporter.py', 'txt_exporter.py')
+_spec = importlib.util.spec_from_file_location('txt_exporter', _PATH)
+txt_exporter = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(txt_exporter)
+
+
+class TestExportPreview(unittest.TestCase):
+    """Tests para get_export_preview."""
+
+    def preview(self, content, max_lines):
+        exporter = txt_exporter.TXTExporter()
+        with mock.patch.object(exporter, 'generate_export_content', return_value=content):
+            return exporter.get_export_preview({}, 'root', {}, max_lines)
+
+    def test_exact_fit_returns_everything(self):
+        """Si caben todas las líneas se devuelve el contenido entero."""
+        self.assertEqual(self.preview("a\nb\nc", 3), "a\nb\nc")
+
+    def test_over_limit_is_cut(self):
+        """Pasado el límite se cortan las líneas y se indica cuántas faltan."""
+        self.assertEqual(self.preview("a\nb\nc\nd", 2), "a\nb\n\n... (2 líneas más) ...")
+
+    def test_zero_or_negative_limit_shows_only_footer(self):
+        """Sin líneas permitidas solo queda el aviso de líneas restantes."""
+        self.assertEqual(self.preview("a\nb\nc", 0), "\n... (3 líneas más) ...")
+        self.assertEqual(self.preview("a\nb\nc", -2), "\n... (3 líneas más) ...")
+
+
+if __name__ == '__main__':
+    unittest.main()